@@ -1,17 +1,76 @@
 # count_letters_and_digits
+import unicodedata
+from functools import lru_cache
+import numpy as np
+
+CHARACTER_CLASSES = ["letters", "digits", "whitespace", "punctuation", "symbols", "other"]
+CHUNK_SIZE = 4 * 1024 * 1024  # characters per chunk when reading files
+
+
+def classify_char(char):
+    # Same rules as the simple loop: isalpha() first, then isdigit().
+    if char.isalpha():
+        return 0
+    elif char.isdigit():
+        return 1
+    elif char.isspace():
+        return 2
+    category = unicodedata.category(char)
+    if category.startswith("P"):
+        return 3
+    elif category.startswith("S"):
+        return 4
+    return 5
+
+
+@lru_cache(maxsize=None)
+def bmp_class_table():
+    # Class of every code point up to U+FFFF, computed once. Lookups into this
+    # array replace one Python method call per character.
+    return np.array([classify_char(chr(code_point)) for code_point in range(0x10000)], dtype=np.uint8)
+
+
+def character_class_counts(text, counts=None):
+    if counts is None:
+        counts = np.zeros(len(CHARACTER_CLASSES), dtype=np.int64)
+    code_points = np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+    in_bmp = code_points < 0x10000
+    counts += np.bincount(bmp_class_table()[code_points[in_bmp]], minlength=len(CHARACTER_CLASSES))
+    # Characters outside the BMP (emoji, rare scripts) are few; classify each distinct one.
+    outside, outside_counts = np.unique(code_points[~in_bmp], return_counts=True)
+    for code_point, count in zip(outside.tolist(), outside_counts.tolist()):
+        counts[classify_char(chr(code_point))] += count
+    return counts
+
+
+def character_class_histogram(text):
+    counts = character_class_counts(text)
+    return dict(zip(CHARACTER_CLASSES, counts.tolist()))
+
+
+def character_class_histogram_file(filePath, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    # Streams the file chunk by chunk, so multi-GB files need only one chunk of memory.
+    counts = np.zeros(len(CHARACTER_CLASSES), dtype=np.int64)
+    with open(filePath, "r", encoding=encoding, errors="replace") as File1:
+        while True:
+            chunk = File1.read(chunk_size)
+            if not chunk:
+                break
+            character_class_counts(chunk, counts)
+    return dict(zip(CHARACTER_CLASSES, counts.tolist()))
+
+
 def count_letters_and_digits(s):
-    letters = 0
-    digits = 0
-    for char in s:
-        if char.isalpha():
-            letters += 1
-        elif char.isdigit():
-            digits += 1
-    return f"Character: {letters}, Digits: {digits}"
+    histogram = character_class_histogram(s)
+    return f"Character: {histogram['letters']}, Digits: {histogram['digits']}"
 
 # توضیحات
 # این تابع تعداد حروف و اعداد موجود در یک رشته را شمارش می‌کند.
 # ورودی: یک رشته (s)
 # خروجی: تعداد حروف و اعداد به صورت یک تاپل (تعداد حروف، تعداد اعداد)
+# character_class_histogram همه دسته‌های کاراکتر (حروف، اعداد، فاصله، علائم نگارشی، نمادها و بقیه) را با NumPy می‌شمارد
+# و character_class_histogram_file همین کار را به صورت تکه‌تکه روی فایل‌های بزرگ انجام می‌دهد.
 
-print(f'Sentences:\n Hello1234World567 \n {count_letters_and_digits("Hello1234World567")}')
+if __name__ == "__main__":
+    print(f'Sentences:\n Hello1234World567 \n {count_letters_and_digits("Hello1234World567")}')
+    print(character_class_histogram("سلام ۱۲۳ Hello, World! 42 😀 €"))
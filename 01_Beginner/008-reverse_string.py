@@ -1,5 +1,135 @@
-def reverse_string(s):
+import mmap
+import os
+import unicodedata
+
+BLOCK_SIZE = 1024 * 1024
+ZERO_WIDTH_JOINER = "\u200d"
+
+
+def is_extending_char(char):
+    # Marks, joiners and variation selectors belong to the character before them.
+    return (unicodedata.category(char) in ("Mn", "Mc", "Me") or char == ZERO_WIDTH_JOINER
+            or "\ufe00" <= char <= "\ufe0f" or "\U0001f3fb" <= char <= "\U0001f3ff")
+
+
+def iter_graphemes(s):
+    # Simple grapheme clusters: a base character plus its marks, emoji joined
+    # with ZWJ, and "\r\n" kept together.
+    cluster = ""
+    for char in s:
+        if cluster and (is_extending_char(char) or cluster[-1] == ZERO_WIDTH_JOINER
+                        or (cluster == "\r" and char == "\n")):
+            cluster += char
+        else:
+            if cluster:
+                yield cluster
+            cluster = char
+    if cluster:
+        yield cluster
+
+
+def reverse_string(s, graphemes=False):
+    # graphemes=True keeps "é" written as e + accent, or 👍🏽, in one piece.
+    if graphemes:
+        return "".join(reversed(list(iter_graphemes(s))))
     return s[::-1]
 
-text = "Python is a high-level, general-purpose programming language. Its design philosophy emphasizes code readability with the use of significant indentation."
-print(f"string: {text}\n reverse version: {reverse_string(text)}")
\ No newline at end of file
+
+def reverse_bytes_in_place(buffer, block_size=BLOCK_SIZE):
+    """
+    Reverse a bytearray, a writable memoryview or an mmap in place.
+
+    bytearray.reverse() does it in C. Other buffers are reversed by swapping
+    one block from the front with one block from the back, so the extra memory
+    is two blocks, not a second copy of the data.
+    """
+    if isinstance(buffer, bytearray):
+        buffer.reverse()
+        return buffer
+    view = memoryview(buffer)
+    size = len(view)
+    half = size // 2
+    for front_start in range(0, half, block_size):
+        length = min(block_size, half - front_start)
+        back_end = size - front_start
+        front = view[front_start:front_start + length].tobytes()
+        back = view[back_end - length:back_end].tobytes()
+        view[front_start:front_start + length] = back[::-1]
+        view[back_end - length:back_end] = front[::-1]
+    view.release()
+    return buffer
+
+
+def reverse_file_in_place(filePath, block_size=BLOCK_SIZE):
+    # Byte-wise reversal through a writable memory map: no read into RAM at all.
+    if os.path.getsize(filePath) == 0:
+        return
+    with open(filePath, "r+b") as File1:
+        with mmap.mmap(File1.fileno(), 0) as mapped:
+            reverse_bytes_in_place(mapped, block_size)
+            mapped.flush()
+
+
+def _utf8_char_start(block):
+    # Index of the first byte in block that starts a UTF-8 character
+    # (continuation bytes look like 0b10xxxxxx).
+    index = 0
+    while index < len(block) and block[index] & 0xC0 == 0x80:
+        index += 1
+    return index
+
+
+def reverse_file(source_path, target_path, block_size=BLOCK_SIZE, encoding="utf-8", graphemes=False):
+    """
+    Write the reverse of source_path into target_path, reading it backwards block by block.
+
+    Only one block is in memory at a time. With encoding=None the bytes are
+    reversed as they are. With UTF-8 text, a block never starts in the middle
+    of a character: those bytes are carried over to the next (earlier) block.
+    With graphemes=True, marks at the start of a block wait for their base
+    character in the same way.
+    """
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        position = source.seek(0, os.SEEK_END)
+        carry = b""
+        while position > 0:
+            start = max(0, position - block_size)
+            source.seek(start)
+            block = source.read(position - start) + carry
+            position = start
+            if encoding is None:
+                carry = b""
+                target.write(block[::-1])
+                continue
+
+            split = _utf8_char_start(block) if position > 0 else 0
+            carry, block = block[:split], block[split:]
+            text = block.decode(encoding, errors="surrogateescape")
+            if graphemes and position > 0:
+                # Leading marks/joiners belong to a character in the earlier block,
+                # and so does a character glued to it by a ZWJ.
+                joined = False
+                if position + split >= 3:
+                    source.seek(position + split - 3)
+                    joined = source.read(3) == ZERO_WIDTH_JOINER.encode(encoding)
+                lead = 0
+                while lead < len(text) and (joined or is_extending_char(text[lead])):
+                    joined = text[lead] == ZERO_WIDTH_JOINER
+                    lead += 1
+                if lead == 0 and text.startswith("\n"):
+                    lead = 1  # may be the second half of "\r\n"
+                carry += text[:lead].encode(encoding, errors="surrogateescape")
+                text = text[lead:]
+            target.write(reverse_string(text, graphemes).encode(encoding, errors="surrogateescape"))
+        if carry:
+            target.write(reverse_string(carry.decode(encoding, errors="surrogateescape"), graphemes)
+                         .encode(encoding, errors="surrogateescape"))
+
+
+if __name__ == "__main__":
+    text = "Python is a high-level, general-purpose programming language. Its design philosophy emphasizes code readability with the use of significant indentation."
+    print(f"string: {text}\n reverse version: {reverse_string(text)}")
+    print(reverse_string("noël 👍🏽", graphemes=True))
+    data = bytearray(b"hello world")
+    reverse_bytes_in_place(memoryview(data), block_size=2)
+    print(data)
@@ -1,6 +1,27 @@
 import numpy as np
+
+def min_max(numbers_list):
+    # One pass for both values: numbers are taken in pairs, the smaller one is
+    # compared with the min and the larger one with the max (~1.5 comparisons
+    # per number instead of 2).
+    iterator = iter(numbers_list)
+    try:
+        min_num = max_num = next(iterator)
+    except StopIteration:
+        raise ValueError("min_max() arg is an empty sequence") from None
+    for first in iterator:
+        second = next(iterator, first)
+        if second < first:
+            first, second = second, first
+        if first < min_num:
+            min_num = first
+        if max_num < second:
+            max_num = second
+    return min_num, max_num
+
 def max_min_in_list(numbers_list:list):
-    return f"max num: {max(numbers_list)}\n min num: {min(numbers_list)}"
+    min_num, max_num = min_max(numbers_list)
+    return f"max num: {max_num}\n min num: {min_num}"
 np.random.seed(1)
 numbers = np.random.randint(1, 200, 50)
 
@@ -19,7 +40,9 @@ def max_min_online():
             break
         else:
             numbersList.append(int(userInput))
-    print(f"numbersList: {numbersList}\n Max.: {max(numbersList)}\n Min.: {min(numbersList)}")
+    min_num, max_num = min_max(numbersList)
+    print(f"numbersList: {numbersList}\n Max.: {max_num}\n Min.: {min_num}")
 
 
-max_min_online()
\ No newline at end of file
+if __name__ == "__main__":
+    max_min_online()
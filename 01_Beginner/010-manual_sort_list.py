@@ -1,57 +1,103 @@
-def manual_sort_list(number_list:list):
-    min_num:int = min(number_list)
-    max_num:int = max(number_list)
-    count_of_min_number:int = number_list.count(min_num)
-    count_of_max_number:int = number_list.count(max_num)
-    print(f"numbers: {number_list}")
-    if count_of_min_number == 1:
-        number_list.remove(min_num)
-    else:
-        for count in range(1, count_of_min_number+1):
-            number_list.remove(min_num)
-    print(f"remove min numbers: {number_list}")
-    if count_of_max_number == 1:
-        number_list.remove(max_num)
-    else:
-        for count in range(1, count_of_max_number+1):
-            number_list.remove(max_num)
-    print(f"remove max numbers: {number_list}")
-    list_len = len(number_list)
-    while True:
-
-        first_num = 0
-        for i in range(first_num, list_len-1):
-            print(f"{i}th Stage: {number_list}")
-            for j in range(i+1, list_len):
-                if number_list[i] >= number_list[j]:
-                    print(f"\t{i}-{j}th Stage: {number_list}")
+def decorate(number_list:list, key):
+    # (key, index, item): the index keeps equal keys in their original order and
+    # means the items themselves are never compared.
+    if isinstance(key, (tuple, list)):
+        key_functions = tuple(key)
+        key = lambda item: tuple(func(item) for func in key_functions)
+    return [(key(item), index, item) for index, item in enumerate(number_list)]
+
+
+def find_min_max(number_list:list):
+    # One pass collects the elements equal to the min and to the max. The
+    # elements themselves are kept (not min * count), so 1 and 1.0 both survive.
+    min_num = max_num = number_list[0]
+    min_numbers = []
+    max_numbers = []
+    for number in number_list:
+        if number < min_num:
+            min_num = number
+            min_numbers = [number]
+        elif number == min_num:
+            min_numbers.append(number)
+        if number > max_num:
+            max_num = number
+            max_numbers = [number]
+        elif number == max_num:
+            max_numbers.append(number)
+    return min_numbers, max_numbers
+
+
+def merge_sort(number_list:list, trace=None):
+    # Bottom-up merge sort: O(n log n) and no recursion, so 10^6 items are fine.
+    items = list(number_list)
+    list_len = len(items)
+    width = 1
+    while width < list_len:
+        merged = []
+        for start in range(0, list_len, 2 * width):
+            left = items[start:start + width]
+            right = items[start + width:start + 2 * width]
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if right[j] < left[i]:
+                    merged.append(right[j])
+                    j += 1
                 else:
-                    number_list[i], number_list[j] = number_list[j], number_list[i]
-                    print(f"\t{i}-{j}th Stage: {number_list}")
-        break
-    print(f"Before append Min and Max: {number_list}")
-    if count_of_min_number == 1:
-        number_list.append(min_num)
-    else:
-        for min_number in range(count_of_min_number):
-            number_list.append(min_num)
-    if count_of_max_number == 1:
-        number_list.insert(0, max_num)
+                    merged.append(left[i])
+                    i += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        items = merged
+        if trace is not None:
+            trace(f"merge width {width}", items)
+        width *= 2
+    return items
+
+
+def manual_sort_list(number_list:list, trace=None, key=None):
+    """
+    Return a new list with the numbers of number_list in ascending order.
+
+    The min and max values are taken out in one linear pass, the rest is merge
+    sorted, and then the min and max values are put back at both ends.
+    trace is an optional callback trace(stage, current_list) to follow the steps;
+    nothing is printed by default.
+    key sorts records by a key function or a tuple of key functions (multi-column);
+    the sort is stable and each key is computed only once.
+    """
+    if key is not None:
+        decorated = manual_sort_list(decorate(number_list, key), trace)
+        return [item for _, _, item in decorated]
+    if len(number_list) <= 1:
+        return list(number_list)
+    min_numbers, max_numbers = find_min_max(number_list)
+    min_num, max_num = min_numbers[0], max_numbers[0]
+    if trace is not None:
+        trace("numbers", number_list)
+
+    middle = [number for number in number_list if number != min_num and number != max_num]
+    if trace is not None:
+        trace("remove min and max numbers", middle)
+
+    middle = merge_sort(middle, trace)
+
+    if min_num == max_num:
+        final_list = min_numbers
     else:
-        maxNumsList = []
-        for max_number in range(count_of_min_number):
-            number_list.insert(0, max_num)
-    
-    print(f"After append Min and Max: {number_list}")
-    print("----------------------------")
-    print("----------------------------")
-    print("----------------------------")
-    print("----------------------------")
-    print(f"final List: \n{number_list[::-1]}")
-
-numbers = [1,25,6,3,9,25,1,1,8,9,25,4,5, 41, -1, 1.23, 1023, -569, 0.26]
-print("Without Sorting Function: ")
-manual_sort_list(numbers)
-
-print("With Sorting Function: ")
-print(sorted(numbers))
\ No newline at end of file
+        final_list = min_numbers + middle + max_numbers
+    if trace is not None:
+        trace("final list", final_list)
+    return final_list
+
+
+def print_trace(stage, number_list):
+    print(f"{stage}: {number_list}")
+
+
+if __name__ == "__main__":
+    numbers = [1,25,6,3,9,25,1,1,8,9,25,4,5, 41, -1, 1.23, 1023, -569, 0.26]
+    print("Without Sorting Function: ")
+    print(manual_sort_list(numbers, trace=print_trace))
+
+    print("With Sorting Function: ")
+    print(sorted(numbers))
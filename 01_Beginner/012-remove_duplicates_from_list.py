@@ -1,3 +1,21 @@
+from hashable import make_hashable
+
+
+def iter_unique(items, key=None):
+    # Streaming, order-preserving dedup: works on any iterable, yields each
+    # first occurrence as soon as it is seen. O(1) per item.
+    seen = set()
+    for item in items:
+        marker = make_hashable(item) if key is None else key(item)
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+def remove_duplicates(items, key=None):
+    return list(iter_unique(items, key))
+
+
 def remove_duplicates_from_list(userList:list):
     # First Method
     # print(f"User List: \n\t{userList}")
@@ -7,9 +25,12 @@ def remove_duplicates_from_list(userList:list):
     #     else:
     #         userList.pop()
     # print(f"Remove Duplicated Items:  \n\t{userList}")
-    # Second Method
-    print(f"The main list: {userList}\n Remove Duplicates: {list(set(userList))}")
-
+    # Second Method: list(set(userList)) lost the original order
+    # Third Method: one pass with a "seen" set keeps the first occurrence of each item in order
+    print(f"The main list: {userList}\n Remove Duplicates: {remove_duplicates(userList)}")
 
 
-remove_duplicates_from_list([1,2,5,"hello", "hel", "owl", "hellow", "hell", "hel", 2, "2"])
+if __name__ == "__main__":
+    remove_duplicates_from_list([1,2,5,"hello", "hel", "owl", "hellow", "hell", "hel", 2, "2"])
+    print(remove_duplicates([{"id": 1, "name": "Ali"}, {"id": 2, "name": "Sara"}, {"id": 1, "name": "Ali R."}], key=lambda row: row["id"]))
+    print(remove_duplicates([[1, 2], [3], [1, 2]]))
@@ -1,8 +1,29 @@
+from collections import Counter
+from hashable import make_hashable
+
+
+def item_frequency(items, key=None):
+    """
+    Return [(item, count), ...] in first-seen order, in one pass over items.
+
+    items can be any iterable (a generator or a file is read only once).
+    key maps each item to what should be counted, e.g. key=str.lower or
+    key=lambda row: row["id"]; the first item seen for each key is reported.
+    Unhashable items (lists, dicts, sets) work without a key.
+    """
+    counts = Counter()
+    first_items = {}
+    for item in items:
+        marker = make_hashable(item) if key is None else key(item)
+        if marker not in first_items:
+            first_items[marker] = item
+        counts[marker] += 1
+    return [(first_items[marker], count) for marker, count in counts.items()]
+
+
 def count_item_frequency(user_list:list):
-    delDuplicated = list(set(user_list))
-    resList = []
-    for item in delDuplicated:
-        resList.append((item, user_list.count(item)))
+    # Old version: user_list.count(item) for every distinct item -> O(n*k)
+    resList = item_frequency(user_list)
     print(f"count_item_frequency (item, count): \n\t {resList}")
 
-# count_item_frequency([1,2,5,"hello", "hel", "owl", "hellow", "hell", "hel", 2, "2", "hello", "owl", "owl"])
\ No newline at end of file
+# count_item_frequency([1,2,5,"hello", "hel", "owl", "hellow", "hell", "hel", 2, "2", "hello", "owl", "owl"])
@@ -1,3 +1,5 @@
+import mmap
+
 def file_create():
     fileName = str(input("Enter file name: "))
     file_open = open(f"./files/{fileName}.txt", 'w')
@@ -10,8 +12,19 @@ def file_create():
         
     
 def file_read():
-    with open("./files/example.txt", 'r') as file1:
-        print(file1.read())
+    # Lines come straight from the memory-mapped file, so big files are never
+    # loaded into one string.
+    with open("./files/example.txt", "rb") as file1:
+        try:
+            mapped = mmap.mmap(file1.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            print()
+            return
+        with mapped:
+            for line in iter(mapped.readline, b""):
+                print(line.decode("utf-8", errors="replace"), end="")
+    print()
 
 def file_write():
     print(f"Write what you want in 'example.txt'")
@@ -27,18 +40,19 @@ def file_edit():
         file1.write(userText)
         print(file1.read())
 
-while True:
-    userInput = str(input("What is your purpose? (create = c, read = r, write = w, edit == e, quite = q): "))
-    if userInput == 'c':
-        file_create()
-    elif userInput == 'r':
-        file_read()
-    elif userInput == 'w':
-        file_write()
-    elif userInput == "e":
-        file_edit()
-    elif userInput == 'q':
-        print("Application Closed.")
-        break
-    else:
-        print("Something went Wrong.")
\ No newline at end of file
+if __name__ == "__main__":
+    while True:
+        userInput = str(input("What is your purpose? (create = c, read = r, write = w, edit == e, quite = q): "))
+        if userInput == 'c':
+            file_create()
+        elif userInput == 'r':
+            file_read()
+        elif userInput == 'w':
+            file_write()
+        elif userInput == "e":
+            file_edit()
+        elif userInput == 'q':
+            print("Application Closed.")
+            break
+        else:
+            print("Something went Wrong.")
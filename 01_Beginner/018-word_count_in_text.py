@@ -1,6 +1,77 @@
+import codecs
+from itertools import chain
+from timeit import timeit
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    # source can be a whole string, an open file (text or binary) or any iterable of chunks.
+    if isinstance(source, (str, bytes)):
+        yield source
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+def word_count_stream(source, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """
+    Count lines, words and bytes in one pass, like the `wc` command.
+
+    Words are separated by any Unicode whitespace, as in str.split() (spaces,
+    tabs, newlines, no-break spaces...). Binary chunks are decoded
+    incrementally, so a file gives the same word count as the same text
+    given as a str; a character cut between two chunks waits for the rest of
+    its bytes. A word cut between two chunks is counted once: if the previous
+    chunk ended inside a word and the next one starts inside a word, that is
+    the same word.
+    """
+    lines = words = byte_count = 0
+    previous_ends_in_word = False
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    # The extra b"" at the end flushes bytes still held by the decoder.
+    for chunk in chain(iter_chunks(source, chunk_size), [b""]):
+        if isinstance(chunk, bytes):
+            byte_count += len(chunk)
+            chunk = decoder.decode(chunk, final=not chunk)
+        else:
+            byte_count += len(chunk.encode(encoding))
+        if not chunk:
+            continue
+        lines += chunk.count("\n")
+        words += len(chunk.split())
+        if previous_ends_in_word and not chunk[:1].isspace():
+            words -= 1
+        previous_ends_in_word = not chunk[-1:].isspace()
+    return {"lines": lines, "words": words, "bytes": byte_count}
+
+
 def word_count_in_text(text:str):
-    split_text = text.split(" ")
-    return len(split_text)
+    return word_count_stream(text)["words"]
+
+
+def word_count_in_file(filePath, chunk_size=CHUNK_SIZE):
+    with open(filePath, "rb") as File1:
+        return word_count_stream(File1, chunk_size)
+
+
+def benchmark_word_count(text:str, repeat=5):
+    # Compare with the plain len(text.split()) that needs the whole text in memory.
+    split_time = timeit(lambda: len(text.split()), number=repeat) / repeat
+    stream_time = timeit(lambda: word_count_stream(text), number=repeat) / repeat
+    chunks = [text[i:i + 64 * 1024] for i in range(0, len(text), 64 * 1024)]
+    chunked_time = timeit(lambda: word_count_stream(chunks), number=repeat) / repeat
+    return {"str.split": split_time, "stream (one chunk)": stream_time, "stream (64K chunks)": chunked_time}
+
 
-text = "God is in the details, said the architect Ludwig mies van der Rohe. This quote recalls contemporary arguments about the role of architecture in software development, and particularly in the Agile world. Bob and I occasionally find ourselves passionately engaged in this dialogue. And yes, mies van der Rohe was attentive to utility and to the timeless forms of building that underlie great architecture. On the other hand, he also personally selected every doorknob for every house he designed. Why? Because small things matter"
-print(word_count_in_text(text=text))
\ No newline at end of file
+if __name__ == "__main__":
+    text = "God is in the details, said the architect Ludwig mies van der Rohe. This quote recalls contemporary arguments about the role of architecture in software development, and particularly in the Agile world. Bob and I occasionally find ourselves passionately engaged in this dialogue. And yes, mies van der Rohe was attentive to utility and to the timeless forms of building that underlie great architecture. On the other hand, he also personally selected every doorknob for every house he designed. Why? Because small things matter"
+    print(word_count_in_text(text=text))
+    print(word_count_stream("one  two\tthree\n four\n"))
+    for name, seconds in benchmark_word_count(text * 20000).items():
+        print(f"{name:<22} {seconds * 1000:.2f} ms")
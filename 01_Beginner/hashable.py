@@ -0,0 +1,23 @@
+"""
+Docstring for 01_Beginner.hashable
+
+make_hashable turns an item into something that can go into a set or be a
+dict key, so duplicates can be found in one pass even when the items are
+lists, dicts or sets.
+
+Containers are tagged with their kind, so items that Python considers
+different stay different: [1, 2] and (1, 2) are not equal, and neither are
+their hashable versions. set and frozenset share a tag because {1} == frozenset({1}).
+"""
+
+
+def make_hashable(item):
+    if isinstance(item, list):
+        return (list, tuple(make_hashable(value) for value in item))
+    if isinstance(item, tuple):
+        return (tuple, tuple(make_hashable(value) for value in item))
+    if isinstance(item, dict):
+        return (dict, frozenset((key, make_hashable(value)) for key, value in item.items()))
+    if isinstance(item, (set, frozenset)):
+        return (set, frozenset(make_hashable(value) for value in item))
+    return item
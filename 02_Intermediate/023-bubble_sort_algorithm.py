@@ -1,27 +1,131 @@
 import numpy as np
+from sort_keys import decorate
 
-def bubble_sort_algorithm(user_list:list):
-    print(f"Before: {user_list}")
-    total_swap = 0
-    i = 0
-    while True:
-        j = i+1
-        if i == len(user_list)-1:
-            if total_swap == 0:
-                break
-            else:
-                total_swap = 0
-                i = 0
+
+def new_sort_stats():
+    return {"passes": 0, "comparisons": 0, "swaps": 0}
+
+
+def _bubble_pass_shrinking(user_list, stats):
+    # After every pass, everything after the last swap is already in place,
+    # so the next pass only has to walk up to that position.
+    bound = len(user_list) - 1
+    while bound > 0:
+        stats["passes"] += 1
+        last_swap = 0
+        for i in range(bound):
+            stats["comparisons"] += 1
+            if user_list[i] > user_list[i+1]:
+                user_list[i], user_list[i+1] = user_list[i+1], user_list[i]
+                stats["swaps"] += 1
+                last_swap = i
+        bound = last_swap
+
+
+def _cocktail_shaker(user_list, stats):
+    # Bubble forwards, then backwards, shrinking both ends of the unsorted window.
+    low = 0
+    high = len(user_list) - 1
+    while low < high:
+        stats["passes"] += 1
+        last_swap = low
+        for i in range(low, high):
+            stats["comparisons"] += 1
+            if user_list[i] > user_list[i+1]:
+                user_list[i], user_list[i+1] = user_list[i+1], user_list[i]
+                stats["swaps"] += 1
+                last_swap = i
+        high = last_swap
+        if low >= high:
+            break
+
+        stats["passes"] += 1
+        last_swap = high
+        for i in range(high, low, -1):
+            stats["comparisons"] += 1
+            if user_list[i-1] > user_list[i]:
+                user_list[i-1], user_list[i] = user_list[i], user_list[i-1]
+                stats["swaps"] += 1
+                last_swap = i
+        low = last_swap
+
+
+def odd_even_transposition_sort(array, stats=None):
+    """
+    Vectorized odd-even transposition sort for 1-D NumPy arrays (sorted in place).
+
+    Each phase compares every (even, odd) or (odd, even) neighbour pair at once,
+    so the Python loop runs once per phase instead of once per comparison.
+    The array is sorted once an even and an odd phase both make no swaps.
+    """
+    if stats is None:
+        stats = new_sort_stats()
+    n = len(array)
+    quiet_phases = 0
+    phase = 0
+    while n > 1 and quiet_phases < 2:
+        start = phase % 2
+        left = array[start:n-1:2]
+        right = array[start+1:n:2]
+        mask = left > right
+        swaps = int(np.count_nonzero(mask))
+        if swaps:
+            # left/right are views, so writing through them updates the array.
+            smaller = right[mask]
+            right[mask] = left[mask]
+            left[mask] = smaller
+            quiet_phases = 0
         else:
-            if user_list[i] > user_list[j]:
-                user_list[i], user_list[j] = user_list[j], user_list[i]
-                total_swap +=1
-                i += 1
-            else:
-                i += 1
-                continue
-    print(f"After: {user_list}")
-
-# bubble_sort_algorithm([5, 2, 9, 1])
-random_list = np.random.randint(0,100,20)
-bubble_sort_algorithm(random_list)
\ No newline at end of file
+            quiet_phases += 1
+        stats["passes"] += 1
+        stats["comparisons"] += len(left)
+        stats["swaps"] += swaps
+        phase += 1
+    return array, stats
+
+
+def bubble_sort_algorithm(user_list, cocktail=False, vectorized=True, key=None):
+    """
+    Sort user_list in place and return (user_list, stats).
+
+    stats counts passes, comparisons and swaps, so the function can be used as
+    a baseline in benchmark comparisons.
+
+    cocktail=True walks the list in both directions (cocktail shaker sort),
+    which moves small values stuck at the end ("turtles") much faster.
+    One-dimensional NumPy arrays use the vectorized odd-even transposition
+    variant unless vectorized=False.
+    key sorts records by a key function or a tuple of key functions (multi-column);
+    keys are computed once up front and equal keys keep their original order.
+    """
+    stats = new_sort_stats()
+    if key is not None:
+        decorated = decorate(user_list, key)
+        if cocktail:
+            _cocktail_shaker(decorated, stats)
+        else:
+            _bubble_pass_shrinking(decorated, stats)
+        user_list[:] = [item for _, _, item in decorated]
+        return user_list, stats
+    if vectorized and isinstance(user_list, np.ndarray) and user_list.ndim == 1:
+        return odd_even_transposition_sort(user_list, stats)
+    if cocktail:
+        _cocktail_shaker(user_list, stats)
+    else:
+        _bubble_pass_shrinking(user_list, stats)
+    return user_list, stats
+
+
+if __name__ == "__main__":
+    # print(bubble_sort_algorithm([5, 2, 9, 1]))
+    random_list = np.random.randint(0, 100, 20)
+    print(f"Before: {random_list}")
+    sorted_list, sort_stats = bubble_sort_algorithm(random_list)
+    print(f"After: {sorted_list}")
+    print(f"Stats: {sort_stats}")
+
+    python_list = random_list[::-1].tolist()
+    print(f"Before: {python_list}")
+    sorted_list, sort_stats = bubble_sort_algorithm(python_list, cocktail=True)
+    print(f"After (cocktail): {sorted_list}")
+    print(f"Stats: {sort_stats}")
@@ -1,4 +1,12 @@
-def quick_sort_algorithm(user_list):
+from sort_keys import decorate
+
+
+def quick_sort_algorithm(user_list, key=None):
+    # با key می‌توان رکوردها را بر اساس یک تابع یا چند تابع (چند ستون) مرتب کرد
+    if key is not None:
+        decorated = quick_sort_algorithm(decorate(user_list, key))
+        return [item for _, _, item in decorated]
+
     # اگر طول لیست ۰ یا ۱ باشد، نیازی به مرتب‌سازی نیست
     if len(user_list) <= 1:
         return user_list
@@ -16,6 +24,9 @@ def quick_sort_algorithm(user_list):
 
 
 
-print(quick_sort_algorithm([5,10,5,6,7,9,8,1,9, 1, 2, 3, 4, 7, 6, 4]))
-print(quick_sort_algorithm([5,10,5,6,7,9,8,1,9, 1, 2, 3, 4, 7, 6]))
-print(quick_sort_algorithm([5,10,5,6,7,9,8,1,9, 1, 2, 3, 4, 7, 6, 4, 3]))
\ No newline at end of file
+if __name__ == "__main__":
+    print(quick_sort_algorithm([5,10,5,6,7,9,8,1,9, 1, 2, 3, 4, 7, 6, 4]))
+    print(quick_sort_algorithm([5,10,5,6,7,9,8,1,9, 1, 2, 3, 4, 7, 6]))
+    print(quick_sort_algorithm([5,10,5,6,7,9,8,1,9, 1, 2, 3, 4, 7, 6, 4, 3]))
+    reviews = [("Ali", 4, "2024-02-01"), ("Sara", 5, "2024-01-15"), ("Reza", 4, "2023-12-30")]
+    print(quick_sort_algorithm(reviews, key=(lambda row: -row[1], lambda row: row[2])))
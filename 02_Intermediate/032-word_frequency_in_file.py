@@ -1,50 +1,396 @@
 # word_frequency_in_file
-import matplotlib.pyplot as plt
-from collections import Counter
+import argparse
+import codecs
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from hashlib import blake2b
+from pathlib import Path
+from frequency_sketches import CountMinSketch, SpaceSaving
+from mmap_reader import count_mapped_tokens, read_mapped_text
+from selection import top_k
+
+CHUNK_SIZE = 1024 * 1024  # characters read per chunk
+
+
+def read_chunks(filePath, chunk_size=CHUNK_SIZE):
+    # Fixed-size chunks keep memory constant, no matter how big the file is.
+    with open(filePath, "r", encoding="utf-8") as File1:
+        while True:
+            chunk = File1.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
 
 def read_file(filePath):
-    text = ""
-    with open(filePath, "r") as File1:
-        for line in File1:
-            text += line
-    return text
+    # Decodes straight from the memory-mapped file (no intermediate read buffer).
+    return read_mapped_text(filePath)
 
-def word_frequency_in_file(filePath):
-    text = read_file(filePath)
-    all_words = text.split()
-    cleaned_words = []
-    for unclean_word in all_words:
-        if "." in unclean_word:
-            unclean_word = unclean_word.replace(".", "")
-            cleaned_words.append(unclean_word)
-        elif "," in unclean_word:
-            unclean_word = unclean_word.replace(",", "")
-            cleaned_words.append(unclean_word)
-        elif "?" in unclean_word:
-            unclean_word = unclean_word.replace("?", "")
-            cleaned_words.append(unclean_word)
-        elif "!" in unclean_word:
-            unclean_word = unclean_word.replace("!", "")
-            cleaned_words.append(unclean_word)
-        elif "@" in unclean_word:
-            unclean_word = unclean_word.replace("@", "")
-            cleaned_words.append(unclean_word)
-        elif "#" in unclean_word:
-            unclean_word = unclean_word.replace("#", "")
-            cleaned_words.append(unclean_word)
+
+def iter_words(chunks):
+    # A chunk can end in the middle of a word; that tail is kept and glued
+    # to the start of the next chunk instead of being counted as two words.
+    leftover = ""
+    for chunk in chunks:
+        chunk = leftover + chunk
+        words = chunk.split()
+        if words and not chunk[-1].isspace():
+            leftover = words.pop()
         else:
-            cleaned_words.append(unclean_word)
-    
-    return Counter(cleaned_words)
-
-def word_distribution(filePath):
-    res_list = word_frequency_in_file(filePath)
-    xy_list = []
-    for key, value in res_list.items():
-        xy_list.append((key, value))
-    most_word_count = sorted(xy_list, key=lambda x: x[-1], reverse=True)[:10]
+            leftover = ""
+        yield words
+    if leftover:
+        yield [leftover]
+
+
+@lru_cache(maxsize=None)
+def punctuation_table():
+    # One translate table that turns every Unicode punctuation character
+    # (category P*) into a space, so Persian marks like "،" "؛" "؟" "«" "»" go too.
+    # A space (not deletion) keeps "this—that" or "state-of-the-art" as separate
+    # words instead of fusing them into "thisthat". Built once, on first use.
+    return {code_point: " " for code_point in range(sys.maxunicode + 1)
+            if unicodedata.category(chr(code_point)).startswith("P")}
+
+
+def normalize_text(text, case_fold=False):
+    # A single str.translate pass removes all punctuation kinds at once.
+    text = text.translate(punctuation_table())
+    if case_fold:
+        text = text.casefold()
+    return text
+
+
+def count_words(chunks, counter=None, case_fold=False):
+    # The Counter is updated chunk by chunk, so only one chunk is in memory at a time.
+    # Whole chunks are normalized before splitting, which is much cheaper than
+    # cleaning every token on its own; tokens made only of punctuation disappear.
+    if counter is None:
+        counter = Counter()
+    normalized_chunks = (normalize_text(chunk, case_fold) for chunk in chunks)
+    for words in iter_words(normalized_chunks):
+        counter.update(words)
+    return counter
+
+
+def word_frequency_in_file(filePath, chunk_size=CHUNK_SIZE, case_fold=False):
+    return count_words(read_chunks(filePath, chunk_size), case_fold=case_fold)
+
+def word_frequency_in_mapped_file(filePath, case_fold=False):
+    # Tokens are counted as raw bytes over the memory-mapped file, then every
+    # distinct token is decoded and normalized once (not once per occurrence).
+    # The extra split() handles non-ASCII whitespace such as "\xa0" inside a token.
+    counter = Counter()
+    for token, count in count_mapped_tokens(filePath).items():
+        for word in normalize_text(token.decode("utf-8", errors="replace"), case_fold).split():
+            counter[word] += count
+    return counter
+
+
+
+# ----- N-grams and co-occurrences -----
+
+def iter_file_words(filePath, chunk_size=CHUNK_SIZE, case_fold=False):
+    normalized_chunks = (normalize_text(chunk, case_fold) for chunk in read_chunks(filePath, chunk_size))
+    for words in iter_words(normalized_chunks):
+        yield from words
+
+
+def iter_ngrams(words, n=2):
+    # Sliding window: only the last n words are kept in memory.
+    window = deque(maxlen=n)
+    for word in words:
+        window.append(word)
+        if len(window) == n:
+            yield tuple(window)
+
+
+def iter_cooccurrences(words, window_size=5):
+    # Every pair of words that appear within window_size words of each other,
+    # as an unordered (alphabetical) pair.
+    previous_words = deque(maxlen=window_size - 1)
+    for word in words:
+        for previous_word in previous_words:
+            yield (previous_word, word) if previous_word <= word else (word, previous_word)
+        previous_words.append(word)
+
+
+def make_frequency_counter(mode="exact", capacity=10000):
+    # exact: Counter (memory grows with distinct items)
+    # space_saving / count_min: fixed memory, approximate counts
+    if mode == "exact":
+        return Counter()
+    if mode == "space_saving":
+        return SpaceSaving(capacity)
+    if mode == "count_min":
+        return CountMinSketch.from_error(track=capacity)
+    raise ValueError(f"Unknown counting mode: {mode}")
+
+
+def ngram_frequency_in_file(filePath, n=2, mode="exact", capacity=10000, case_fold=False):
+    counter = make_frequency_counter(mode, capacity)
+    counter.update(iter_ngrams(iter_file_words(filePath, case_fold=case_fold), n))
+    return counter
+
+
+def cooccurrence_frequency_in_file(filePath, window_size=5, mode="exact", capacity=10000, case_fold=False):
+    counter = make_frequency_counter(mode, capacity)
+    counter.update(iter_cooccurrences(iter_file_words(filePath, case_fold=case_fold), window_size))
+    return counter
+
+# ----- Map-reduce over many files -----
+
+SHARD_SIZE = 64 * 1024 * 1024  # bytes per shard; larger files are split into byte ranges
+# Bytes that str.split() treats as whitespace. None of them can appear inside a
+# multi-byte UTF-8 character, so they are safe places to cut a file.
+WHITESPACE_BYTES = re.compile(rb"[ \t\n\r\x0b\x0c\x1c-\x1f]")
+
+
+def collect_text_files(directory, pattern="*.txt"):
+    return sorted(str(path) for path in Path(directory).rglob(pattern) if path.is_file())
+
+
+def plan_shards(file_paths, shard_size=SHARD_SIZE):
+    shards = []
+    for file_path in file_paths:
+        file_size = os.path.getsize(file_path)
+        for start in range(0, max(file_size, 1), shard_size):
+            shards.append((file_path, start, min(start + shard_size, file_size)))
+    return shards
+
+
+def read_byte_range_chunks(filePath, start, end, chunk_size=CHUNK_SIZE):
+    """
+    Yield the text of bytes [start, end) of a file as decoded chunks.
+
+    A word belongs to the shard it starts in: a shard skips the tail of a word
+    that began in the previous shard, and reads past `end` to finish its own last word.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(filePath, "rb") as File1:
+        position = start
+        if start > 0:
+            File1.seek(start - 1)
+            if not WHITESPACE_BYTES.match(File1.read(1)):
+                while True:
+                    block = File1.read(chunk_size)
+                    if not block:
+                        return
+                    match = WHITESPACE_BYTES.search(block)
+                    if match:
+                        position += match.start()
+                        break
+                    position += len(block)
+                File1.seek(position)
+        if position >= end:
+            return
+
+        last_block = b""
+        while position < end:
+            block = File1.read(min(chunk_size, end - position))
+            if not block:
+                break
+            position += len(block)
+            last_block = block
+            yield decoder.decode(block)
+
+        if last_block and not WHITESPACE_BYTES.match(last_block[-1:]):
+            while True:
+                block = File1.read(chunk_size)
+                if not block:
+                    break
+                match = WHITESPACE_BYTES.search(block)
+                if match:
+                    yield decoder.decode(block[:match.start()])
+                    break
+                yield decoder.decode(block)
+        yield decoder.decode(b"", final=True)
+
+
+def count_shard(shard, case_fold=False):
+    filePath, start, end = shard
+    return count_words(read_byte_range_chunks(filePath, start, end), case_fold=case_fold)
+
+
+def word_frequency_in_files(paths, workers=None, shard_size=SHARD_SIZE, case_fold=False):
+    """
+    Count words over many files (or a directory of .txt files) with a process pool.
+
+    Map: every shard (a small file, or a byte range of a big one) is counted in a worker.
+    Reduce: the per-shard Counters are merged into one.
+    """
+    if isinstance(paths, (str, Path)) and os.path.isdir(paths):
+        paths = collect_text_files(paths)
+    elif isinstance(paths, (str, Path)):
+        paths = [paths]
+    shards = plan_shards(paths, shard_size)
+    workers = workers or os.cpu_count() or 1
+
+    total = Counter()
+    if workers == 1 or len(shards) <= 1:
+        for shard in shards:
+            total.update(count_shard(shard, case_fold))
+        return total
+
+    punctuation_table()  # build once here; forked workers inherit it
+    # Many small shards per task keeps the inter-process overhead low for thousands of files.
+    task_size = max(1, len(shards) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for counter in pool.map(partial(count_shard, case_fold=case_fold), shards, chunksize=task_size):
+            total.update(counter)
+    return total
+
+
+# ----- Incremental counting for growing files -----
+
+CHECKPOINT_DIR = "./files/word_count_checkpoints"
+FINGERPRINT_SIZE = 4096  # bytes at the start of the file used to detect a replaced file
+
+
+def checkpoint_path(filePath, checkpoint_dir=CHECKPOINT_DIR):
+    file_id = blake2b(os.path.abspath(filePath).encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(checkpoint_dir, f"{file_id}.json")
+
+
+def file_fingerprint(filePath, size):
+    with open(filePath, "rb") as File1:
+        return blake2b(File1.read(min(size, FINGERPRINT_SIZE)), digest_size=16).hexdigest()
+
+
+def load_checkpoint(filePath, checkpoint_dir=CHECKPOINT_DIR):
+    try:
+        with open(checkpoint_path(filePath, checkpoint_dir), "r", encoding="utf-8") as File1:
+            return json.load(File1)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_checkpoint(filePath, checkpoint, checkpoint_dir=CHECKPOINT_DIR):
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    target = checkpoint_path(filePath, checkpoint_dir)
+    # Temp file + fsync + rename, so a crash never leaves half a checkpoint.
+    with open(target + ".tmp", "w", encoding="utf-8") as File1:
+        json.dump(checkpoint, File1, ensure_ascii=False)
+        File1.flush()
+        os.fsync(File1.fileno())
+    os.replace(target + ".tmp", target)
+
+
+def find_last_whitespace(filePath, start, end, chunk_size=CHUNK_SIZE):
+    # Scan backwards from `end`; returns the byte index of the last whitespace, or -1.
+    with open(filePath, "rb") as File1:
+        block_end = end
+        while block_end > start:
+            block_start = max(start, block_end - chunk_size)
+            File1.seek(block_start)
+            block = File1.read(block_end - block_start)
+            matches = list(WHITESPACE_BYTES.finditer(block))
+            if matches:
+                return block_start + matches[-1].start()
+            block_end = block_start
+    return -1
+
+
+def incremental_word_frequency(filePath, checkpoint_dir=CHECKPOINT_DIR, case_fold=False):
+    """
+    Count words of a file that only grows, reusing the last run's checkpoint.
+
+    The checkpoint keeps the byte offset already counted and the Counter up to
+    it, so a rerun only reads the bytes appended since then. The offset always
+    stops after a whitespace byte: a word that is still being written at the
+    end of the file is counted in the result but not saved, and is read again
+    next time. If the file shrank or its first bytes changed (rotated or
+    replaced), everything is counted again.
+    """
+    size = os.path.getsize(filePath)
+    checkpoint = load_checkpoint(filePath, checkpoint_dir)
+    if (checkpoint is None or checkpoint["case_fold"] != case_fold or checkpoint["offset"] > size
+            or checkpoint["fingerprint"] != file_fingerprint(filePath, checkpoint["offset"])):
+        checkpoint = {"path": os.path.abspath(filePath), "offset": 0, "case_fold": case_fold,
+                      "fingerprint": file_fingerprint(filePath, 0), "counts": {}}
+
+    offset = checkpoint["offset"]
+    counts = Counter(checkpoint["counts"])
+    new_offset = find_last_whitespace(filePath, offset, size) + 1
+    if new_offset > offset:
+        count_words(read_byte_range_chunks(filePath, offset, new_offset), counts, case_fold)
+        checkpoint["offset"] = new_offset
+        checkpoint["fingerprint"] = file_fingerprint(filePath, new_offset)
+        checkpoint["counts"] = counts
+        save_checkpoint(filePath, checkpoint, checkpoint_dir)
+    else:
+        new_offset = offset
+
+    # The unfinished tail after the last whitespace.
+    return count_words(read_byte_range_chunks(filePath, new_offset, size), counts.copy(), case_fold)
+
+
+def top_words(counts, top_n=10):
+    # Only the top_n most frequent words are needed, so a heap is enough (no full sort).
+    return top_k(counts.items(), top_n, key=lambda x: x[-1])
+
+
+def count_path(path, case_fold=False, workers=1, incremental=False):
+    if incremental:
+        return incremental_word_frequency(path, case_fold=case_fold)
+    if os.path.isdir(path) or workers != 1:
+        return word_frequency_in_files(path, workers=workers, case_fold=case_fold)
+    return word_frequency_in_file(path, case_fold=case_fold)
+
+
+def word_report(filePath, top_n=10, report_format="text", counts=None):
+    if counts is None:
+        counts = word_frequency_in_file(filePath)
+    most_word_count = top_words(counts, top_n)
+    if report_format == "json":
+        return json.dumps({
+            "file": str(filePath),
+            "total_words": sum(counts.values()),
+            "unique_words": len(counts),
+            "top_words": [{"word": word, "count": count} for word, count in most_word_count],
+        }, ensure_ascii=False, indent=2)
+    lines = [f"File: {filePath}", f"Total words: {sum(counts.values())}", f"Unique words: {len(counts)}", ""]
+    lines += [f"{rank:>3}. {word:<25} {count}" for rank, (word, count) in enumerate(most_word_count, start=1)]
+    return "\n".join(lines)
+
+
+def word_distribution(filePath, top_n=10, output=None, counts=None):
+    """
+    Plot the top_n words as a horizontal bar chart.
+
+    With output (a .png or .svg path) the chart is rendered with the Agg backend
+    and saved, so it works without a display (cron, CI). Without output the
+    chart is shown in a window. matplotlib is imported only here, so importing
+    this module stays fast when no plot is requested.
+    """
+    if counts is None:
+        counts = word_frequency_in_file(filePath)
+    most_word_count = top_words(counts, top_n)
     x = [key for key,_ in most_word_count]
     y = [value for _,value in most_word_count]
+
+    if output is not None:
+        # Figure + Agg canvas: no pyplot state and no GUI backend involved.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        figure = Figure(figsize=(9,6))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.barh(x, y)
+        axes.legend(["Counts"])
+        axes.set_xlabel("Counts")
+        axes.set_ylabel("Words")
+        figure.tight_layout()
+        figure.savefig(output)
+        return output
+
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(9,6))
     plt.barh(x, y)
     plt.legend(["Counts"])
@@ -52,6 +398,30 @@ def word_distribution(filePath):
     plt.ylabel("Words")
     plt.show()
 
-# print(read_file("./files/lorem.txt"))
-# print(word_frequency_in_file("./files/lorem.txt"))
-print(word_distribution("./files/lorem.txt"))
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Word frequency report for a text file or a directory of .txt files")
+    parser.add_argument("path", nargs="?", default="./files/lorem.txt", help="Text file or directory")
+    parser.add_argument("--top", type=int, default=10, help="Number of most frequent words")
+    parser.add_argument("--report", choices=["text", "json"], help="Print a text or JSON report instead of plotting")
+    parser.add_argument("--plot", help="Save the chart to this .png or .svg file (headless)")
+    parser.add_argument("--case-fold", action="store_true", help="Count words case-insensitively")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for map-reduce counting")
+    parser.add_argument("--incremental", action="store_true", help="Only count bytes appended since the last run (uses a checkpoint)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    # print(read_file("./files/lorem.txt"))
+    # print(word_frequency_in_file("./files/lorem.txt"))
+    # print(word_frequency_in_mapped_file("./files/lorem.txt"))
+    # print(word_frequency_in_files("./files", workers=4).most_common(10))
+    # print(ngram_frequency_in_file("./files/lorem.txt", n=2, mode="space_saving", capacity=1000).most_common(10))
+    args = get_args()
+    word_counts = count_path(args.path, case_fold=args.case_fold, workers=args.workers, incremental=args.incremental)
+    if args.report:
+        print(word_report(args.path, args.top, args.report, counts=word_counts))
+    if args.plot:
+        print(f"Chart saved to {word_distribution(args.path, args.top, output=args.plot, counts=word_counts)}")
+    if not args.report and not args.plot:
+        word_distribution(args.path, args.top, counts=word_counts)
@@ -1,49 +1,472 @@
+import csv
+import heapq
 import json
+import os
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+
+SNAPSHOT_PATH = r'./files/phonebook_text_file.json'
+JOURNAL_PATH = r'./files/phonebook_text_file.journal'
+
+
+class Trie:
+    """Prefix tree: every node is a dict of children; values are stored at the node where their key ends."""
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, key, value):
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, set()).add(value)
+
+    def remove(self, key, value):
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return
+        node.get(None, set()).discard(value)
+
+    def starts_with(self, prefix, limit=20):
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        # Depth-first walk below the prefix node, stopping after `limit` values.
+        results = []
+        stack = [node]
+        while stack and len(results) < limit:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is None:
+                    results.extend(sorted(child)[:limit - len(results)])
+                else:
+                    stack.append(child)
+        return results
+
+
+class PhonebookSearchIndex:
+    """
+    Search indexes kept next to the phone book dict:
+    - a trie over usernames (case-insensitive prefix search),
+    - a trie over reversed numbers, so "numbers ending with 4564" is a prefix search,
+    - a trigram index over usernames for fuzzy (typo-tolerant) search.
+    """
+
+    def __init__(self):
+        self.name_trie = Trie()
+        self.number_suffix_trie = Trie()
+        self.trigrams = {}
+        self.trigram_counts = {}
+
+    @staticmethod
+    def name_trigrams(username):
+        padded = f"  {username.casefold()} "
+        return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+    def add(self, username, number):
+        self.name_trie.insert(username.casefold(), username)
+        self.number_suffix_trie.insert(number[::-1], username)
+        trigrams = self.name_trigrams(username)
+        self.trigram_counts[username] = len(trigrams)
+        for trigram in trigrams:
+            self.trigrams.setdefault(trigram, set()).add(username)
+
+    def remove(self, username, number):
+        self.name_trie.remove(username.casefold(), username)
+        self.number_suffix_trie.remove(number[::-1], username)
+        self.trigram_counts.pop(username, None)
+        for trigram in self.name_trigrams(username):
+            self.trigrams.get(trigram, set()).discard(username)
+
+    def prefix_search(self, prefix, limit=20):
+        return self.name_trie.starts_with(prefix.casefold(), limit)
+
+    def number_suffix_search(self, suffix, limit=20):
+        return self.number_suffix_trie.starts_with(suffix[::-1], limit)
+
+    def fuzzy_search(self, query, limit=10, min_score=None):
+        """
+        Usernames similar to query, best first (typo-tolerant).
+
+        Candidates share trigrams with the query and are scored by Jaccard
+        similarity (shared / all distinct trigrams of both). By default the
+        minimum score scales with the query length and lets about two typos
+        through: a swap of two letters changes up to 4 trigrams, which is a lot
+        for a short name ("usre3" and "user3" share only 2 of 10). The best candidates (ties go
+        to names of similar length) are then re-ranked with difflib's
+        similarity ratio, which tells "user3" apart from "user7".
+        """
+        query_trigrams = self.name_trigrams(query)
+        if min_score is None:
+            trigram_count = len(query_trigrams)
+            min_score = max(0.1, (trigram_count - 8) / (trigram_count + 8))
+        shared = Counter()
+        for trigram in query_trigrams:
+            shared.update(self.trigrams.get(trigram, ()))
+        scored = []
+        for username, common in shared.items():
+            score = common / (len(query_trigrams) + self.trigram_counts[username] - common)
+            if score >= min_score:
+                scored.append((score, -abs(len(username) - len(query)), username))
+        candidates = heapq.nlargest(max(10 * limit, 100), scored)
+        query = query.casefold()
+        candidates.sort(key=lambda candidate: (SequenceMatcher(None, query, candidate[2].casefold()).ratio(),
+                                               candidate[0]), reverse=True)
+        return [username for _, _, username in candidates[:limit]]
+
+
+class PhonebookStore:
+    """
+    Append-only (log-structured) phone book.
+
+    Every create/update/delete is one small JSON line appended to the journal
+    file, instead of rewriting the whole phone book. The in-memory index (a dict)
+    is rebuilt on startup from the last snapshot (phonebook_text_file.json) plus
+    the journal. Once the journal has `compact_every` records, the index is
+    written as a new snapshot and the journal starts empty again.
+    """
+
+    def __init__(self, snapshot_path=SNAPSHOT_PATH, journal_path=JOURNAL_PATH, compact_every=1000):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self.index = {}
+        self.journal_records = 0
+        self._search = None
+        self._load()
+        self.journal = open(self.journal_path, "a", encoding="utf-8")
+
+    @property
+    def search(self):
+        # The search indexes are built on the first search only, so plain
+        # create/update/delete sessions do not pay for them.
+        if self._search is None:
+            self._search = PhonebookSearchIndex()
+            for username, number in self.index.items():
+                self._search.add(username, number)
+        return self._search
+
+    def _load(self):
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as SnapshotFile:
+                self.index = json.load(SnapshotFile)
+        except FileNotFoundError:
+            self.index = {}
+        good_end = 0
+        try:
+            with open(self.journal_path, "rb") as JournalFile:
+                for line in JournalFile:
+                    if not line.endswith(b"\n"):
+                        # A crash in the middle of an append leaves one torn last line.
+                        break
+                    good_end += len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._apply(record)
+                    self.journal_records += 1
+                torn = JournalFile.seek(0, os.SEEK_END) > good_end
+        except FileNotFoundError:
+            return
+        if torn:
+            # Cut the torn line off; otherwise the next record would be appended
+            # to it and be skipped together with it on the next start.
+            with open(self.journal_path, "r+b") as JournalFile:
+                JournalFile.truncate(good_end)
+
+    def _apply(self, record):
+        username = record["username"]
+        old_number = self.index.get(username)
+        if record["op"] == "put":
+            self.index[username] = record["number"]
+        elif record["op"] == "delete":
+            self.index.pop(username, None)
+        if self._search is not None:
+            if old_number is not None:
+                self._search.remove(username, old_number)
+            if record["op"] == "put":
+                self._search.add(username, record["number"])
+
+    def _append(self, record):
+        self._append_many([record])
+
+    def _append_many(self, records, compact=True):
+        # One write and one flush for the whole batch.
+        self.journal.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        self.journal.flush()
+        for record in records:
+            self._apply(record)
+        self.journal_records += len(records)
+        if compact and self.journal_records >= self.compact_every:
+            self.compact()
+
+    def put(self, username, number):
+        self._append({"op": "put", "username": username, "number": number})
+
+    def put_many(self, contacts, compact=True):
+        """
+        Add or update many (username, number) pairs with a single journal write.
+
+        Contacts that are already stored with the same number are skipped.
+        Returns the number of records written.
+        """
+        batch = {}
+        for username, number in contacts:
+            if self.index.get(username) != number:
+                batch[username] = number
+        self._append_many([{"op": "put", "username": username, "number": number}
+                           for username, number in batch.items()], compact)
+        return len(batch)
+
+    def delete(self, username):
+        if username not in self.index:
+            return False
+        self._append({"op": "delete", "username": username})
+        return True
+
+    def get(self, username, default=None):
+        return self.index.get(username, default)
+
+    def items(self):
+        return self.index.items()
+
+    def __contains__(self, username):
+        return username in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def compact(self):
+        # 1) write the new snapshot atomically (temp file + fsync + rename),
+        # 2) only then empty the journal. A crash in between just replays
+        #    journal records that are already in the snapshot, which is harmless.
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as SnapshotFile:
+            json.dump(self.index, SnapshotFile, ensure_ascii=False)
+            SnapshotFile.flush()
+            os.fsync(SnapshotFile.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self.journal.close()
+        self.journal = open(self.journal_path, "w", encoding="utf-8")
+        self.journal_records = 0
+
+    def close(self):
+        # Compaction is left to the compact_every threshold (or an explicit
+        # compact()), so a short session never rewrites the whole snapshot.
+        self.journal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# ----- Bulk import / export (CSV and vCard) -----
+
+IMPORT_BATCH_SIZE = 10000
+
+
+def read_csv_contacts(file_path):
+    # Streams rows; a first row of "username,number" (any case) is treated as a header.
+    # utf-8-sig drops the byte order mark Excel and Windows put at the start.
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as CsvFile:
+        for row_number, row in enumerate(csv.reader(CsvFile)):
+            if len(row) < 2:
+                continue
+            username, number = row[0].strip(), row[1].strip()
+            if row_number == 0 and (username.lower(), number.lower()) == ("username", "number"):
+                continue
+            yield username, number
+
+
+def vcard_escape(value):
+    return (value.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;")
+            .replace("\r\n", "\\n").replace("\n", "\\n").replace("\r", "\\n"))
+
+
+def vcard_unescape(value):
+    return re.sub(r"\\([\\,;nN])", lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+def split_vcard_components(value):
+    # Splits a structured value such as N on ";" that is not escaped as "\;".
+    components = [""]
+    escaped = False
+    for char in value:
+        if escaped:
+            components[-1] += "\\" + char
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == ";":
+            components.append("")
+        else:
+            components[-1] += char
+    return [vcard_unescape(component) for component in components]
+
+
+def iter_unfolded_lines(lines):
+    # A line that starts with a space or a tab continues the previous one (line folding).
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def read_vcard_contacts(file_path):
+    """
+    Stream (name, number) pairs from a vCard 3.0/4.0 file.
+
+    Folded lines are joined, "group." prefixes (item1.TEL) are ignored and
+    escaped text is decoded. FN gives the name; without FN, N is used as
+    "Given Family". The first TEL is the number. vCard 2.1 QUOTED-PRINTABLE
+    values are not decoded.
+    """
+    username = number = None
+    from_fn = False
+    with open(file_path, "r", encoding="utf-8-sig") as VcardFile:
+        for line in iter_unfolded_lines(VcardFile):
+            name, _, value = line.partition(":")
+            field = name.split(";")[0].rsplit(".", 1)[-1].strip().upper()
+            if field == "BEGIN":
+                username = number = None
+                from_fn = False
+            elif field == "FN":
+                username = vcard_unescape(value).strip()
+                from_fn = True
+            elif field == "N" and not from_fn:
+                # N is Family;Given;Additional;Prefix;Suffix.
+                family, given, additional, prefix, suffix = (split_vcard_components(value) + [""] * 5)[:5]
+                username = " ".join(part for part in (prefix, given, additional, family, suffix) if part.strip())
+            elif field == "TEL" and number is None:
+                number = value.strip()
+            elif field == "END" and username and number:
+                yield username, number
+
+
+def iter_batches(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_contacts(store, file_path, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Stream a .csv or .vcf file into the store, one journal write per batch.
+
+    Rows with an empty username or number are skipped, and so are contacts
+    that are already stored with the same number. Compaction is done once at
+    the end instead of after every batch.
+    """
+    reader = read_vcard_contacts if file_path.lower().endswith((".vcf", ".vcard")) else read_csv_contacts
+    read = written = 0
+    for batch in iter_batches(reader(file_path), batch_size):
+        read += len(batch)
+        written += store.put_many(((username, number) for username, number in batch if username and number),
+                                  compact=False)
+    if store.journal_records >= store.compact_every:
+        store.compact()
+    return {"read": read, "written": written, "skipped": read - written}
+
+
+def export_contacts(store, file_path):
+    if file_path.lower().endswith((".vcf", ".vcard")):
+        with open(file_path, "w", encoding="utf-8") as VcardFile:
+            VcardFile.writelines(f"BEGIN:VCARD\nVERSION:3.0\nFN:{vcard_escape(username)}\nTEL:{number}\nEND:VCARD\n"
+                                 for username, number in store.items())
+    else:
+        with open(file_path, "w", encoding="utf-8", newline="") as CsvFile:
+            writer = csv.writer(CsvFile)
+            writer.writerow(["username", "number"])
+            writer.writerows(store.items())
+    return len(store)
+
 
 def phonebook_text_file():
-    with open(r'./files/phonebook_text_file.json', 'r+') as JsonPreData:
-        getData = json.load(JsonPreData)
-    userInput = str(input("Phone Book App. \n1.\tCreate(c)\n2.\tRead(r)\n3.\tUpdate(u)\n4.\tDelete(d)\nWhat is your Purpose? "))
-    if userInput == "c":
+    # One session = one loaded store: the search indexes are built on the first
+    # search and then reused by every later search, until the user quits.
+    with PhonebookStore() as store:
         while True:
-            print("Create new member (if you finish, just type 'exit' in username input)")
-            username = str(input("Enter username: "))
-            if username == "exit":
+            try:
+                userInput = str(input("Phone Book App. \n1.\tCreate(c)\n2.\tRead(r)\n3.\tUpdate(u)\n4.\tDelete(d)\n5.\tSearch(s)\n6.\tImport CSV/vCard(i)\n7.\tExport CSV/vCard(e)\n8.\tQuit(q)\nWhat is your Purpose? "))
+            except EOFError:
                 break
-            else:
-                number = str(input("Enter number: "))
-                if username == "" and number == "":
+            if userInput == "q":
+                break
+            elif userInput == "c":
+                while True:
+                    print("Create new member (if you finish, just type 'exit' in username input)")
+                    username = str(input("Enter username: "))
+                    if username == "exit":
+                        break
+                    else:
+                        number = str(input("Enter number: "))
+                        if username == "" and number == "":
+                            print("Username or User Number cannot be empty...")
+                            break
+                        store.put(username, number)
+            elif userInput == "r":
+                print(dict(store.items()))
+            elif userInput == "u":
+                username = str(input("Enter username (if username does not exist, then we added to phone book as a new member): "))
+                updated_number = str(input("Enter number: "))
+                if updated_number == "":
                     print("Username or User Number cannot be empty...")
-                    break
-                getData[username] = number
-                with open(r'./files/phonebook_text_file.json', 'w') as SetNewJasonData:
-                    SetNewJasonData.writelines(json.dumps(getData))
-    elif userInput == "r":
-        with open(r'./files/phonebook_text_file.json', 'r+') as ReadJsonData:
-            getData = json.load(ReadJsonData)
-            print(getData)
-    elif userInput == "u":
-        username = str(input("Enter username (if username does not exist, then we added to phone book as a new member): "))
-        updated_number = str(input("Enter number: "))
-        if updated_number == "":
-            print("Username or User Number cannot be empty...")
-        else:
-            with open(r'./files/phonebook_text_file.json', 'r+') as UpdateJsonData:
-                getData = json.load(UpdateJsonData)
-            getData[username] = updated_number
-            with open(r'./files/phonebook_text_file.json', 'w') as SetNewJasonData:
-                SetNewJasonData.writelines(json.dumps(getData))
-    elif userInput == "d":
-        username = str(input("Enter username (if username does not exist, we delete no member): "))
-        if username == "":
-            print("You delete no user...")
-        else:
-            with open(r'./files/phonebook_text_file.json', 'r+') as UpdateJsonData:
-                getData = json.load(UpdateJsonData)
-            del getData[username]
-            with open(r'./files/phonebook_text_file.json', 'w') as SetNewJasonData:
-                SetNewJasonData.writelines(json.dumps(getData))
-    else:
-        print("Something went wrong.")
+                else:
+                    store.put(username, updated_number)
+            elif userInput == "d":
+                username = str(input("Enter username (if username does not exist, we delete no member): "))
+                if username == "":
+                    print("You delete no user...")
+                elif not store.delete(username):
+                    print("You delete no user...")
+            elif userInput == "s":
+                query = str(input("Enter the start of a username, or the last digits of a number: "))
+                if query.isdigit():
+                    matches = store.search.number_suffix_search(query)
+                else:
+                    matches = store.search.prefix_search(query) or store.search.fuzzy_search(query)
+                if matches:
+                    for username in matches:
+                        print(f"{username}: {store.get(username)}")
+                else:
+                    print("No member found...")
+            elif userInput == "i":
+                file_path = str(input("Enter .csv or .vcf file path: "))
+                try:
+                    result = import_contacts(store, file_path)
+                except OSError as error:
+                    print(f"Cannot read {file_path}: {error}")
+                    continue
+                print(f"Read {result['read']} contacts, added/updated {result['written']}, skipped {result['skipped']} duplicates or empty rows.")
+            elif userInput == "e":
+                file_path = str(input("Enter .csv or .vcf file path: "))
+                try:
+                    print(f"Exported {export_contacts(store, file_path)} contacts to {file_path}")
+                except OSError as error:
+                    print(f"Cannot write {file_path}: {error}")
+            else:
+                print("Something went wrong.")
+
 
-phonebook_text_file()
\ No newline at end of file
+if __name__ == "__main__":
+    phonebook_text_file()
@@ -1,3 +1,91 @@
 def palindrome_checker(text:str):
+    # The slice and the comparison both run in C; much faster than a Python loop.
     return text == text[::-1]
-print(palindrome_checker("radar"))
+
+
+def normalized_palindrome_checker(text:str):
+    """
+    Palindrome check that ignores case, spaces and punctuation.
+
+    "A man, a plan, a canal: Panama!" -> True
+    Characters that are not letters or digits are skipped by the pointers
+    themselves, so no cleaned copy of the text is built.
+    """
+    left = 0
+    right = len(text) - 1
+    while left < right:
+        if not text[left].isalnum():
+            left += 1
+        elif not text[right].isalnum():
+            right -= 1
+        else:
+            if text[left].casefold() != text[right].casefold():
+                return False
+            left += 1
+            right -= 1
+    return True
+
+
+def longest_palindromic_substring(text:str):
+    """
+    Manacher's algorithm: the longest palindromic substring in O(n) time.
+
+    radius[i] is the palindrome radius around position i of the text with a
+    separator between every character (so even and odd lengths are handled
+    the same way). A palindrome found earlier is mirrored to skip comparisons.
+    """
+    if not text:
+        return ""
+    # Separators are implicit: even positions are gaps, odd positions are characters.
+    size = 2 * len(text) + 1
+    radius = [0] * size
+    center = right_edge = 0
+    best_center = best_radius = 0
+    for i in range(size):
+        if i < right_edge:
+            radius[i] = min(right_edge - i, radius[2 * center - i])
+        # Expand while the characters on both sides match (gaps always match).
+        while (i - radius[i] - 1 >= 0 and i + radius[i] + 1 < size and
+               ((i + radius[i] + 1) % 2 == 0 or
+                text[(i - radius[i] - 1) // 2] == text[(i + radius[i] + 1) // 2])):
+            radius[i] += 1
+        if i + radius[i] > right_edge:
+            center = i
+            right_edge = i + radius[i]
+        if radius[i] > best_radius:
+            best_center = i
+            best_radius = radius[i]
+    start = (best_center - best_radius) // 2
+    return text[start:start + best_radius]
+
+
+def batch_palindrome_check(strings, normalized=True):
+    # Generator: works on any iterable (millions of strings) with constant memory.
+    checker = normalized_palindrome_checker if normalized else palindrome_checker
+    for text in strings:
+        yield text, checker(text)
+
+
+def palindromes_in_file(filePath, normalized=True, encoding="utf-8"):
+    # One string per line; the file is read line by line, never loaded whole.
+    with open(filePath, "r", encoding=encoding) as File1:
+        lines = (line.rstrip("\r\n") for line in File1)
+        for text, is_palindrome in batch_palindrome_check(lines, normalized):
+            if is_palindrome:
+                yield text
+
+
+def count_palindromes_in_file(filePath, normalized=True, encoding="utf-8"):
+    checked = palindromes = 0
+    with open(filePath, "r", encoding=encoding) as File1:
+        lines = (line.rstrip("\r\n") for line in File1)
+        for _, is_palindrome in batch_palindrome_check(lines, normalized):
+            checked += 1
+            palindromes += is_palindrome
+    return {"checked": checked, "palindromes": palindromes}
+
+
+if __name__ == "__main__":
+    print(palindrome_checker("radar"))
+    print(normalized_palindrome_checker("A man, a plan, a canal: Panama!"))
+    print(longest_palindromic_substring("forgeeksskeegfor"))
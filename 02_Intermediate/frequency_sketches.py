@@ -0,0 +1,177 @@
+"""
+Docstring for 02_Intermediate.frequency_sketches
+
+Bounded-memory frequency counting for very large streams.
+
+A Counter needs one entry per distinct item, which is too much for n-grams of
+a huge corpus. These two classes use a fixed amount of memory instead and give
+approximate answers:
+
+CountMinSketch -> estimated count of any item (never under-estimates);
+                  can also track the heaviest items it has seen.
+SpaceSaving    -> the top items of a stream with a guaranteed error bound,
+                  using `capacity` counters.
+
+Both offer add(), most_common() and [item] lookups, like a Counter.
+"""
+
+import heapq
+import math
+from array import array
+from hashlib import blake2b
+
+
+def _item_bytes(item):
+    if isinstance(item, tuple):
+        return "\x1f".join(map(str, item)).encode("utf-8")
+    return str(item).encode("utf-8")
+
+
+class CountMinSketch:
+    def __init__(self, width=2**16, depth=4, track=0):
+        if not 1 <= depth <= 16:
+            raise ValueError("depth must be between 1 and 16")
+        self.width = width
+        self.depth = depth
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self.total = 0
+        # Optional: keep the `track` items with the highest estimates.
+        self.track = track
+        self.heavy = {}
+        # Min-heap of (estimate, item) over `heavy`; outdated entries are skipped lazily.
+        self._heap = []
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01, track=0):
+        # Estimates are within epsilon * total of the true count with probability 1 - delta.
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), track)
+
+    def _positions(self, item):
+        # One deterministic 64-byte hash gives a 4-byte index for each row, so
+        # sketches built in different processes can be merged.
+        digest = blake2b(_item_bytes(item), digest_size=64).digest()
+        return [int.from_bytes(digest[4*row:4*row+4], "little") % self.width for row in range(self.depth)]
+
+    def add(self, item, count=1):
+        self.total += count
+        estimate = None
+        for row, position in zip(self.rows, self._positions(item)):
+            row[position] += count
+            if estimate is None or row[position] < estimate:
+                estimate = row[position]
+        if self.track:
+            self._track(item, estimate)
+        return estimate
+
+    def _track(self, item, estimate):
+        if item not in self.heavy and len(self.heavy) >= self.track:
+            if estimate <= self._smallest_heavy():
+                return
+            del self.heavy[heapq.heappop(self._heap)[1]]
+        self.heavy[item] = estimate
+        heapq.heappush(self._heap, (estimate, item))
+        if len(self._heap) > 4 * self.track:
+            self._heap = [(value, key) for key, value in self.heavy.items()]
+            heapq.heapify(self._heap)
+
+    def _smallest_heavy(self):
+        # Same lazy min-heap as SpaceSaving: drop entries whose estimate is outdated.
+        while self.heavy.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0]
+
+    def estimate(self, item):
+        return min(row[position] for row, position in zip(self.rows, self._positions(item)))
+
+    def __getitem__(self, item):
+        return self.estimate(item)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Only sketches with the same width and depth can be merged")
+        for row, other_row in zip(self.rows, other.rows):
+            for position, count in enumerate(other_row):
+                if count:
+                    row[position] += count
+        self.total += other.total
+        for item in set(self.heavy) | set(other.heavy):
+            self._track(item, self.estimate(item))
+        return self
+
+    def most_common(self, k=None):
+        items = [(item, self.estimate(item)) for item in self.heavy]
+        items.sort(key=lambda pair: pair[1], reverse=True)
+        return items if k is None else items[:k]
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitters (Metwally et al.).
+
+    At most `capacity` items are counted. When a new item arrives and the table
+    is full, it replaces the item with the smallest count and inherits that count
+    as its error. Every item with a true frequency above total / capacity is
+    guaranteed to be in the table.
+    """
+
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        # Min-heap of (count, item); entries whose count is outdated are skipped lazily.
+        self._heap = []
+
+    def add(self, item, count=1):
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            smallest_count, smallest = self._pop_smallest()
+            del self.counts[smallest]
+            del self.errors[smallest]
+            self.counts[item] = smallest_count + count
+            self.errors[item] = smallest_count
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(value, key) for key, value in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_smallest(self):
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def __getitem__(self, item):
+        return self.counts.get(item, 0)
+
+    def error(self, item):
+        return self.errors.get(item, 0)
+
+    def most_common(self, k=None):
+        if k is None:
+            return sorted(self.counts.items(), key=lambda pair: pair[1], reverse=True)
+        return heapq.nlargest(k, self.counts.items(), key=lambda pair: pair[1])
+
+
+if __name__ == "__main__":
+    import random
+    stream = [random.choice("aaaaabbbcd") + random.choice("xyz") for _ in range(10000)]
+    sketch = CountMinSketch(width=256, depth=4, track=5)
+    heavy_hitters = SpaceSaving(capacity=10)
+    sketch.update(stream)
+    heavy_hitters.update(stream)
+    print(f"Count-Min top 5: {sketch.most_common(5)}")
+    print(f"Space-Saving top 5: {heavy_hitters.most_common(5)}")
@@ -0,0 +1,89 @@
+"""
+Docstring for 02_Intermediate.mmap_reader
+
+Memory-mapped file reader for the text exercises.
+
+The file is mapped with mmap instead of being read into a Python str, so the
+operating system pages it in on demand and there is no second copy in memory.
+Tokens are found directly in the mapped bytes, and only the pieces that are
+actually needed are decoded:
+
+count_mapped_tokens -> Counter of raw byte tokens (decode each distinct word once)
+iter_mapped_words   -> decoded words, one at a time
+iter_mapped_lines   -> decoded lines, one at a time
+read_mapped_text    -> decoded text of a byte range
+
+Words are split on ASCII whitespace only (space, tab, newlines, ...), which is
+safe on UTF-8 bytes because those bytes never occur inside a multi-byte character.
+Callers that need Unicode whitespace can split the decoded tokens again.
+"""
+
+import mmap
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+CHUNK_SIZE = 1024 * 1024  # bytes sliced from the map at a time
+TOKEN_BYTES = re.compile(rb"\S+")
+
+
+@contextmanager
+def open_mapped(filePath):
+    with open(filePath, "rb") as File1:
+        try:
+            mapped = mmap.mmap(File1.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def count_mapped_tokens(filePath, chunk_size=CHUNK_SIZE):
+    # bytes.split() and Counter both run in C; slicing the map one chunk at a time
+    # keeps at most one chunk of bytes alive next to the mapping.
+    counter = Counter()
+    leftover = b""
+    with open_mapped(filePath) as mapped:
+        for position in range(0, len(mapped), chunk_size):
+            chunk = leftover + mapped[position:position + chunk_size]
+            tokens = chunk.split()
+            if tokens and not chunk[-1:].isspace():
+                leftover = tokens.pop()
+            else:
+                leftover = b""
+            counter.update(tokens)
+    if leftover:
+        counter[leftover] += 1
+    return counter
+
+
+def iter_mapped_words(filePath, encoding="utf-8"):
+    with open_mapped(filePath) as mapped:
+        for match in TOKEN_BYTES.finditer(mapped):
+            yield match.group().decode(encoding, errors="replace")
+
+
+def iter_mapped_lines(filePath, encoding="utf-8"):
+    with open_mapped(filePath) as mapped:
+        if not mapped:
+            return
+        while True:
+            line = mapped.readline()
+            if not line:
+                break
+            yield line.decode(encoding, errors="replace")
+
+
+def read_mapped_text(filePath, start=0, end=None, encoding="utf-8"):
+    with open_mapped(filePath) as mapped:
+        end = len(mapped) if end is None else end
+        return mapped[start:end].decode(encoding, errors="replace")
+
+
+if __name__ == "__main__":
+    print(count_mapped_tokens("./files/lorem.txt").most_common(5))
+    print(next(iter_mapped_lines("./files/lorem.txt")))
@@ -0,0 +1,73 @@
+"""
+Docstring for 02_Intermediate.selection
+
+Selection helpers shared by the exercises.
+
+When only a handful of items are needed, a full O(n log n) sort is wasted work:
+top_k        -> the k largest (or smallest) items with a heap, O(n log k)
+quickselect  -> the k-th smallest item in average O(n)
+median       -> median built on quickselect
+"""
+
+import heapq
+import random
+
+
+def top_k(items, k, key=None, largest=True):
+    # heapq keeps only k items in memory, so items can also be a generator.
+    if largest:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+def quickselect(values, k, key=None):
+    """
+    Return the k-th smallest item (k starts at 0) without sorting values.
+
+    Works on a copy of values, so the input is not reordered.
+    """
+    if key is None:
+        key = lambda item: item
+    # Keys are computed once and kept next to their items.
+    pairs = [(key(item), item) for item in values]
+    if not 0 <= k < len(pairs):
+        raise IndexError("k is out of range")
+
+    low = 0
+    high = len(pairs) - 1
+    while True:
+        if low == high:
+            return pairs[low][1]
+        pivot = pairs[random.randint(low, high)][0]
+
+        # Three-way partition of pairs[low:high+1] around the pivot.
+        window = pairs[low:high+1]
+        less = [pair for pair in window if pair[0] < pivot]
+        equal = [pair for pair in window if pair[0] == pivot]
+        greater = [pair for pair in window if pivot < pair[0]]
+        pairs[low:high+1] = less + equal + greater
+
+        if k < low + len(less):
+            high = low + len(less) - 1
+        elif k < low + len(less) + len(equal):
+            return pairs[k][1]
+        else:
+            low = low + len(less) + len(equal)
+
+
+def median(values):
+    items = list(values)
+    if not items:
+        raise ValueError("median() arg is an empty sequence")
+    middle = len(items) // 2
+    if len(items) % 2 == 1:
+        return quickselect(items, middle)
+    return (quickselect(items, middle - 1) + quickselect(items, middle)) / 2
+
+
+if __name__ == "__main__":
+    numbers = [random.randint(1, 200) for _ in range(50)]
+    print(f"numbers: {numbers}")
+    print(f"top 5: {top_k(numbers, 5)}")
+    print(f"10th smallest: {quickselect(numbers, 9)} (sorted: {sorted(numbers)[9]})")
+    print(f"median: {median(numbers)}")
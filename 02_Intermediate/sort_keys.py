@@ -0,0 +1,23 @@
+"""
+Docstring for 02_Intermediate.sort_keys
+
+Key helpers shared by the hand-written sorts (023, 024).
+
+make_sort_key -> one key function from a function or a tuple/list of them
+                 (multi-column sorting)
+decorate      -> Schwartzian transform: [(key, index, item), ...]. Every key is
+                 computed once; the index keeps items with equal keys in their
+                 original order (stable), so the items themselves are never compared.
+"""
+
+
+def make_sort_key(key):
+    if isinstance(key, (tuple, list)):
+        key_functions = tuple(key)
+        return lambda item: tuple(func(item) for func in key_functions)
+    return key
+
+
+def decorate(items, key):
+    key = make_sort_key(key)
+    return [(key(item), index, item) for index, item in enumerate(items)]
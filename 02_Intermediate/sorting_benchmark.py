@@ -0,0 +1,239 @@
+"""
+Docstring for 02_Intermediate.sorting_benchmark
+
+Sorting Benchmark Suite
+Compare the sort implementations of this repository on different data shapes.
+
+Every registered algorithm is run against sorted, reversed, random, few-unique
+and nearly-sorted inputs at several sizes. For each run the suite reports:
+time (best of a few repeats)
+number of comparisons
+peak memory (tracemalloc)
+whether the output matches sorted()
+
+New algorithms can be plugged in with the register_sort decorator.
+
+Usage:
+python sorting_benchmark.py --sizes 100 500 1000 --repeat 3
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import tracemalloc
+from contextlib import redirect_stdout
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+
+BASE_DIR = Path(__file__).resolve().parent
+REPO_DIR = BASE_DIR.parent
+
+SORT_ALGORITHMS = {}
+
+
+@lru_cache(maxsize=None)
+def load_module(file_path):
+    # Exercise files start with a number and contain '-', so they cannot be imported by name.
+    file_path = Path(file_path)
+    module_name = file_path.stem.replace("-", "_").lstrip("0123456789_")
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def register_sort(name):
+    def decorator(func):
+        SORT_ALGORITHMS[name] = func
+        return func
+    return decorator
+
+
+@register_sort("manual_sort_list")
+def run_manual_sort(values):
+    module = load_module(REPO_DIR / "01_Beginner" / "010-manual_sort_list.py")
+    return module.manual_sort_list(list(values))
+
+
+@register_sort("bubble_sort")
+def run_bubble_sort(values):
+    module = load_module(BASE_DIR / "023-bubble_sort_algorithm.py")
+    sorted_list, _ = module.bubble_sort_algorithm(list(values))
+    return sorted_list
+
+
+@register_sort("cocktail_sort")
+def run_cocktail_sort(values):
+    module = load_module(BASE_DIR / "023-bubble_sort_algorithm.py")
+    sorted_list, _ = module.bubble_sort_algorithm(list(values), cocktail=True)
+    return sorted_list
+
+
+@register_sort("bubble_sort_numpy")
+def run_bubble_sort_numpy(values):
+    module = load_module(BASE_DIR / "023-bubble_sort_algorithm.py")
+    sorted_array, _ = module.bubble_sort_algorithm(module.np.array(values))
+    return list(sorted_array)
+
+
+@register_sort("quick_sort")
+def run_quick_sort(values):
+    module = load_module(BASE_DIR / "024-quick_sort_algorithm.py")
+    return module.quick_sort_algorithm(list(values))
+
+
+@register_sort("builtin_sorted")
+def run_builtin_sorted(values):
+    return sorted(values)
+
+
+# ----- Input shapes -----
+
+def sorted_input(size, rng):
+    return list(range(size))
+
+
+def reversed_input(size, rng):
+    return list(range(size, 0, -1))
+
+
+def random_input(size, rng):
+    return [rng.randint(0, size * 10) for _ in range(size)]
+
+
+def few_unique_input(size, rng):
+    return [rng.randint(0, 9) for _ in range(size)]
+
+
+def nearly_sorted_input(size, rng):
+    values = list(range(size))
+    for _ in range(max(1, size // 20)):
+        i = rng.randrange(size)
+        j = rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+INPUT_SHAPES = {
+    "sorted": sorted_input,
+    "reversed": reversed_input,
+    "random": random_input,
+    "few_unique": few_unique_input,
+    "nearly_sorted": nearly_sorted_input,
+}
+
+
+class CountedValue:
+    """Wraps a value and counts every comparison made against it."""
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    @staticmethod
+    def _unwrap(other):
+        return other.value if isinstance(other, CountedValue) else other
+
+    def __lt__(self, other):
+        CountedValue.comparisons += 1
+        return self.value < self._unwrap(other)
+
+    def __le__(self, other):
+        CountedValue.comparisons += 1
+        return self.value <= self._unwrap(other)
+
+    def __gt__(self, other):
+        CountedValue.comparisons += 1
+        return self.value > self._unwrap(other)
+
+    def __ge__(self, other):
+        CountedValue.comparisons += 1
+        return self.value >= self._unwrap(other)
+
+    def __eq__(self, other):
+        CountedValue.comparisons += 1
+        return self.value == self._unwrap(other)
+
+    def __ne__(self, other):
+        CountedValue.comparisons += 1
+        return self.value != self._unwrap(other)
+
+    __hash__ = None
+
+
+def _quiet_call(sort_func, values):
+    # Some exercises print while sorting; keep the benchmark output readable.
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return sort_func(values)
+
+
+def benchmark_one(sort_func, values, repeat=3):
+    # A separate, instrumented run measures comparisons and peak memory,
+    # so the wrapper overhead does not leak into the timings below.
+    counted_values = [CountedValue(value) for value in values]
+    CountedValue.comparisons = 0
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    _quiet_call(sort_func, counted_values)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best_time = None
+    result = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = _quiet_call(sort_func, values)
+        elapsed = perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+
+    return {
+        "time": best_time,
+        "comparisons": CountedValue.comparisons,
+        "peak_memory": peak_memory,
+        "valid": list(result) == sorted(values),
+    }
+
+
+def run_benchmark(sizes=(100, 500, 1000), shapes=None, algorithms=None, repeat=3, seed=1):
+    shapes = shapes or list(INPUT_SHAPES)
+    algorithms = algorithms or list(SORT_ALGORITHMS)
+    rng = random.Random(seed)
+    # Warm up: load every exercise module before anything is timed or traced.
+    for name in algorithms:
+        _quiet_call(SORT_ALGORITHMS[name], [1, 0])
+    results = []
+    for size in sizes:
+        for shape in shapes:
+            values = INPUT_SHAPES[shape](size, rng)
+            for name in algorithms:
+                row = benchmark_one(SORT_ALGORITHMS[name], values, repeat=repeat)
+                row.update({"algorithm": name, "shape": shape, "size": size})
+                results.append(row)
+    return results
+
+
+def print_report(results):
+    header = f"{'size':>7} {'shape':<14} {'algorithm':<18} {'time (ms)':>11} {'comparisons':>12} {'peak mem (KB)':>14} {'valid':>6}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"{row['size']:>7} {row['shape']:<14} {row['algorithm']:<18} {row['time'] * 1000:>11.3f} {row['comparisons']:>12} {row['peak_memory'] / 1024:>14.1f} {str(row['valid']):>6}")
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Benchmark the sort implementations of this repository")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 500, 1000], help="Input sizes")
+    parser.add_argument("--shapes", nargs="+", choices=list(INPUT_SHAPES), default=None, help="Input shapes")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SORT_ALGORITHMS), default=None, help="Algorithms to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is reported)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the inputs")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print_report(run_benchmark(args.sizes, args.shapes, args.algorithms, args.repeat, args.seed))
@@ -36,10 +36,20 @@ basic object-oriented design
 
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import argparse
 import json
+import os
+import re
+import sqlite3
+from bisect import bisect_left, insort
+from pathlib import Path
 from random import sample
-from time import sleep
+from time import perf_counter
+from atomic_writer import atomic_write_json
+
+DATABASE_PATH = "./files/library-database.json"
+SQLITE_DATABASE_PATH = "./files/library-database.db"
 
 class BookNotFoundError(Exception):
     pass
@@ -59,81 +69,449 @@ class BookRemoveError(Exception):
 def generate_book_id():
     random_id_samples = sample("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", 4)
     return "".join(random_id_samples)
-      
+
+
+class BookSearchIndex:
+    """
+    Inverted indexes over the catalog, so a search never scans every book.
+
+    Words of titles and authors, IDs and availability each map to the set of
+    titles that have them (all case-insensitive). A sorted list of the known
+    words answers prefix queries with bisect. search() intersects the sets of
+    every field that is given, starting with the smallest one.
+    """
+
+    def __init__(self):
+        self.indexes = {"title": {}, "author": {}, "id": {}, "available": {}}
+        self._sorted_words = {}
+
+    @staticmethod
+    def words(text):
+        return re.findall(r"\w+", str(text).casefold())
+
+    @staticmethod
+    def is_available(value):
+        return str(value).strip().casefold() == "true"
+
+    def _fields(self, book_title, book_info):
+        yield "title", self.words(book_title)
+        yield "author", self.words(book_info["Author"])
+        yield "id", [str(book_info["ID"]).casefold()]
+        yield "available", [self.is_available(book_info["Available"])]
+
+    def add(self, book_title, book_info):
+        for field_name, keys in self._fields(book_title, book_info):
+            index = self.indexes[field_name]
+            for key in keys:
+                if key not in index:
+                    index[key] = set()
+                    if field_name in self._sorted_words:
+                        insort(self._sorted_words[field_name], key)
+                index[key].add(book_title)
+
+    def remove(self, book_title, book_info):
+        for field_name, keys in self._fields(book_title, book_info):
+            index = self.indexes[field_name]
+            for key in keys:
+                titles = index.get(key)
+                if titles is not None:
+                    titles.discard(book_title)
+                    if not titles:
+                        del index[key]
+                        if field_name in self._sorted_words:
+                            sorted_words = self._sorted_words[field_name]
+                            del sorted_words[bisect_left(sorted_words, key)]
+
+    def _matching(self, field_name, word, prefix):
+        index = self.indexes[field_name]
+        if not prefix:
+            return index.get(word, set())
+        # Sorted once on the first prefix query, then kept sorted by add/remove.
+        sorted_words = self._sorted_words.get(field_name)
+        if sorted_words is None:
+            sorted_words = self._sorted_words[field_name] = sorted(index)
+        matches = set()
+        position = bisect_left(sorted_words, word)
+        while position < len(sorted_words) and sorted_words[position].startswith(word):
+            matches |= index[sorted_words[position]]
+            position += 1
+        return matches
+
+    def search(self, title=None, author=None, book_id=None, available=None, prefix=True, limit=None):
+        """
+        Titles matching every given field (None = any).
+
+        title/author: every word must match (the last word as a prefix when
+        prefix=True, so "harry pot" finds "Harry Potter"). book_id: exact ID,
+        or ID prefix. available: True or False.
+        """
+        candidate_sets = []
+        for field_name, query in (("title", title), ("author", author)):
+            if query:
+                query_words = self.words(query)
+                for position, word in enumerate(query_words):
+                    candidate_sets.append(self._matching(field_name, word, prefix and position == len(query_words) - 1))
+        if book_id:
+            candidate_sets.append(self._matching("id", str(book_id).casefold(), prefix))
+        if available is not None:
+            candidate_sets.append(self._matching("available", self.is_available(available), False))
+        if not candidate_sets:
+            return []
+        candidate_sets.sort(key=len)
+        results = set(candidate_sets[0])
+        for titles in candidate_sets[1:]:
+            results &= titles
+            if not results:
+                break
+        results = sorted(results)
+        return results if limit is None else results[:limit]
+
+
+class LibraryRepository:
+    """
+    The library database, loaded once and kept in memory.
+
+    Reads come from the cached dict. Before each access the file's mtime and
+    size are compared with the ones seen at load time (one os.stat, no parse);
+    if another program changed the file, it is loaded again. Changes only mark
+    the cache dirty; flush() writes it back atomically. While there are
+    unflushed changes the cache wins, so the last writer wins on a conflict.
+    """
+
+    def __init__(self, path=DATABASE_PATH):
+        self.path = path
+        self._data = None
+        self._signature = None
+        self._search_index = None
+        self.dirty = False
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @property
+    def data(self):
+        if self.dirty:
+            return self._data
+        signature = self._file_signature()
+        if self._data is None or signature != self._signature:
+            try:
+                with open(self.path, 'r') as f1:
+                    self._data = json.loads(f1.read())
+            except FileNotFoundError:
+                self._data = {}
+            self._signature = signature
+            self._search_index = None
+        return self._data
+
+    @property
+    def search_index(self):
+        # Built on the first search only, then kept up to date by put/remove.
+        data = self.data
+        if self._search_index is None:
+            self._search_index = BookSearchIndex()
+            for book_title, book_info in data.items():
+                self._search_index.add(book_title, book_info)
+        return self._search_index
+
+    def search(self, title=None, author=None, book_id=None, available=None, prefix=True, limit=None):
+        return self.search_index.search(title, author, book_id, available, prefix, limit)
+
+    def get(self, book_title, default=None):
+        return self.data.get(book_title, default)
+
+    def titles(self):
+        return self.data.keys()
+
+    def put(self, book_title, book_info):
+        data = self.data
+        if self._search_index is not None:
+            if book_title in data:
+                self._search_index.remove(book_title, data[book_title])
+            self._search_index.add(book_title, book_info)
+        data[book_title] = book_info
+        self.dirty = True
+
+    def remove(self, book_title):
+        book_info = self.data.pop(book_title)
+        if self._search_index is not None:
+            self._search_index.remove(book_title, book_info)
+        self.dirty = True
+
+    def __contains__(self, book_title):
+        return book_title in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def flush(self):
+        if self.dirty:
+            atomic_write_json(self.path, self._data)
+            self._signature = self._file_signature()
+            self.dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
+class SqliteLibraryRepository:
+    """
+    SQLite storage with the same methods as LibraryRepository.
+
+    Every book is one row, so a change touches one row instead of rewriting
+    the whole catalog. ID, author and availability have their own indexed
+    columns, and a book_words table (word -> title) answers the same word and
+    prefix searches as BookSearchIndex. Changes are collected in a transaction
+    that flush() commits. WAL mode lets other CLI users keep reading while
+    one of them writes, and the connection waits (timeout) instead of failing
+    when the database is busy.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS books (
+            title     TEXT PRIMARY KEY,
+            id        TEXT NOT NULL,
+            id_key    TEXT NOT NULL,
+            author    TEXT NOT NULL,
+            available INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS books_id_key ON books (id_key);
+        CREATE INDEX IF NOT EXISTS books_author ON books (author);
+        CREATE INDEX IF NOT EXISTS books_available ON books (available);
+        CREATE TABLE IF NOT EXISTS book_words (
+            field TEXT NOT NULL,
+            word  TEXT NOT NULL,
+            title TEXT NOT NULL,
+            PRIMARY KEY (field, word, title)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS book_words_title ON book_words (title);
+    """
+
+    def __init__(self, path=SQLITE_DATABASE_PATH, timeout=5.0):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+
+    @staticmethod
+    def _book_info(row):
+        book_id, author, available = row
+        return {"ID": book_id, "Author": author, "Available": str(bool(available))}
+
+    @property
+    def data(self):
+        # Whole catalog as the JSON-style dict; only for callers that really need all of it.
+        rows = self.connection.execute("SELECT title, id, author, available FROM books ORDER BY title")
+        return {title: self._book_info(row) for title, *row in rows}
+
+    def get(self, book_title, default=None):
+        row = self.connection.execute("SELECT id, author, available FROM books WHERE title = ?", (book_title,)).fetchone()
+        return default if row is None else self._book_info(row)
+
+    def titles(self):
+        return [title for title, in self.connection.execute("SELECT title FROM books ORDER BY title")]
+
+    def put_many(self, books):
+        # books: iterable of (title, {"ID", "Author", "Available"}); runs inside the open transaction.
+        book_rows = []
+        word_rows = []
+        for book_title, book_info in books:
+            book_rows.append((book_title, str(book_info["ID"]), str(book_info["ID"]).casefold(), book_info["Author"],
+                              int(BookSearchIndex.is_available(book_info["Available"]))))
+            word_rows.extend(("title", word, book_title) for word in set(BookSearchIndex.words(book_title)))
+            word_rows.extend(("author", word, book_title) for word in set(BookSearchIndex.words(book_info["Author"])))
+        self.connection.executemany("DELETE FROM book_words WHERE title = ?", [(row[0],) for row in book_rows])
+        self.connection.executemany("INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?, ?)", book_rows)
+        self.connection.executemany("INSERT OR IGNORE INTO book_words VALUES (?, ?, ?)", word_rows)
+        return len(book_rows)
+
+    def put(self, book_title, book_info):
+        self.put_many([(book_title, book_info)])
+
+    def remove(self, book_title):
+        if self.connection.execute("DELETE FROM books WHERE title = ?", (book_title,)).rowcount == 0:
+            raise KeyError(book_title)
+        self.connection.execute("DELETE FROM book_words WHERE title = ?", (book_title,))
+
+    def __contains__(self, book_title):
+        return self.connection.execute("SELECT 1 FROM books WHERE title = ?", (book_title,)).fetchone() is not None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    @property
+    def dirty(self):
+        return self.connection.in_transaction
+
+    def search(self, title=None, author=None, book_id=None, available=None, prefix=True, limit=None):
+        conditions = []
+        params = []
+        for field_name, query in (("title", title), ("author", author)):
+            if query:
+                query_words = BookSearchIndex.words(query)
+                for position, word in enumerate(query_words):
+                    if prefix and position == len(query_words) - 1:
+                        # A range on the (field, word) primary key, so the index is used.
+                        conditions.append("title IN (SELECT title FROM book_words WHERE field = ? AND word >= ? AND word < ?)")
+                        params += [field_name, word, word + "\U0010ffff"]
+                    else:
+                        conditions.append("title IN (SELECT title FROM book_words WHERE field = ? AND word = ?)")
+                        params += [field_name, word]
+        if book_id:
+            book_id = str(book_id).casefold()
+            if prefix:
+                conditions.append("id_key >= ? AND id_key < ?")
+                params += [book_id, book_id + "\U0010ffff"]
+            else:
+                conditions.append("id_key = ?")
+                params.append(book_id)
+        if available is not None:
+            # Half of the catalog matches either value, so the index on it only
+            # helps when nothing else narrows the search; "+" tells SQLite not to use it.
+            conditions.append("+available = ?" if conditions else "available = ?")
+            params.append(int(BookSearchIndex.is_available(available)))
+        if not conditions:
+            return []
+        query = "SELECT title FROM books WHERE " + " AND ".join(conditions) + " ORDER BY title"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [title for title, in self.connection.execute(query, params)]
+
+    def flush(self):
+        self.connection.commit()
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.connection.rollback()
+        self.close()
+
+
+def open_repository(path=DATABASE_PATH):
+    # The storage backend is picked by file extension: .db/.sqlite/.sqlite3 -> SQLite, anything else -> JSON.
+    if Path(path).suffix.lower() in (".db", ".sqlite", ".sqlite3"):
+        return SqliteLibraryRepository(path)
+    return LibraryRepository(path)
+
+
+def migrate_json_to_sqlite(json_path=DATABASE_PATH, sqlite_path=SQLITE_DATABASE_PATH):
+    # One transaction for the whole catalog; returns the number of books copied.
+    with open(json_path, 'r') as f1:
+        data: dict = json.loads(f1.read())
+    with SqliteLibraryRepository(sqlite_path) as repository:
+        # A 64 MB page cache (default is 2 MB) roughly halves the time of a big import.
+        repository.connection.execute("PRAGMA cache_size = -65536")
+        return repository.put_many(data.items())
+
+
+_default_repository = None
+
+def get_default_repository():
+    global _default_repository
+    if _default_repository is None:
+        _default_repository = open_repository()
+    return _default_repository
+
+def set_default_repository(repository):
+    global _default_repository
+    _default_repository = repository
+
 def get_data_from_json_file():
-    with open("./files/library-database.json", 'r') as f1:
-        data:dict = json.loads(f1.read())
-    return data
+    return get_default_repository().data
      
 @dataclass
 class SetBookInfo:
     book_title: str
     book_author: str
     book_isAvailable: str
+    repository: LibraryRepository | SqliteLibraryRepository = field(default_factory=get_default_repository, repr=False, compare=False)
+    book_id: str = field(default_factory=generate_book_id, repr=False, compare=False)
         
         
     def add_book_info_to_data_dict(self):
-        data = get_data_from_json_file()
-        data[self.book_title] = {"ID": generate_book_id(), "Author": self.book_author, "Available": self.book_isAvailable}
-        return data
+        # Safe to call more than once: the ID is picked once per SetBookInfo.
+        book_info = {"ID": self.book_id, "Author": self.book_author, "Available": self.book_isAvailable}
+        self.repository.put(self.book_title, book_info)
+        return {self.book_title: book_info}
     
     def update_database(self):
-        data = self.add_book_info_to_data_dict()
-        with open("./files/library-database.json", 'w') as f1:
-            f1.write(json.dumps(data))
+        self.add_book_info_to_data_dict()
+        self.repository.flush()
 
 @dataclass
 class RemoveBook:
     book_title:str
+    repository: LibraryRepository | SqliteLibraryRepository = field(default_factory=get_default_repository, repr=False, compare=False)
     
     def get_all_book_names_from_database(self):
-        data = get_data_from_json_file()
-        get_books_name = [book_name for book_name in data.keys()]
-        return get_books_name
+        return list(self.repository.titles())
     
     def check_book_search_result_and_remove_book(self):
-        book_names_list = self.get_all_book_names_from_database()
-        if self.book_title in book_names_list:
+        if self.book_title in self.repository:
             print(f"FINISH... \n{self.book_title} found in Book Lists...")
-            data = get_data_from_json_file()
-            print(f"{self.book_title}: \nBook ID: \t {data[self.book_title]["ID"]}\nBook Author: \t {data[self.book_title]["Author"]}\nBook Availability: \t {data[self.book_title]["Available"]}")
+            book = self.repository.get(self.book_title)
+            print(f"{self.book_title}: \nBook ID: \t {book["ID"]}\nBook Author: \t {book["Author"]}\nBook Availability: \t {book["Available"]}")
             question_for_removing = str(input(f"Do You Want to Remove <{self.book_title}> book (y/n): "))
             if question_for_removing == "y":
-                del data[self.book_title]
-                with open("./files/library-database.json", 'w') as f1:
-                    f1.write(json.dumps(data))
+                self.repository.remove(self.book_title)
+                self.repository.flush()
             else:
                 print("You Remove Nothing from Library")
         else:
             raise BookNotFoundError("404 NOT FOUND :)\nCannot found Book.")
+    
+    def remove_book(self):
+        # Same as above without the (y/n) question; used by the batch mode.
+        if self.book_title not in self.repository:
+            raise BookNotFoundError("404 NOT FOUND :)\nCannot found Book.")
+        self.repository.remove(self.book_title)
 
         
 @dataclass
 class Book_Search:
     book_title: str
+    repository: LibraryRepository | SqliteLibraryRepository = field(default_factory=get_default_repository, repr=False, compare=False)
     
     
     def get_all_book_names_from_database(self):
-        data = get_data_from_json_file()
-        get_books_name = [book_name for book_name in data.keys()]    
-        return get_books_name
+        return list(self.repository.titles())
     
     def check_book_search_result(self):
-        book_names_list = self.get_all_book_names_from_database()
-        if self.book_title in book_names_list:
+        book = self.repository.get(self.book_title)
+        if book is not None:
             print(f"FINISH... \n{self.book_title} found in Book Lists...")
-            data = get_data_from_json_file()
-            print(f"Book Name: \t {self.book_title}\nBook ID: \t {data[self.book_title]["ID"]}\nBook Author: \t {data[self.book_title]["Author"]}\nBook Availability: \t {data[self.book_title]["Available"]}")
+            print(f"Book Name: \t {self.book_title}\nBook ID: \t {book["ID"]}\nBook Author: \t {book["Author"]}\nBook Availability: \t {book["Available"]}")
         else:
             raise BookNotFoundError("404 NOT FOUND :)\nCannot found Book.")
     
     
+    def search_books(self, author=None, book_id=None, available=None, prefix=True, limit=20):
+        # Case-insensitive search on any mix of title words, author, ID and availability.
+        titles = self.repository.search(self.book_title or None, author, book_id, available, prefix, limit)
+        if not titles:
+            raise BookNotFoundError("404 NOT FOUND :)\nCannot found Book.")
+        return {book_title: self.repository.get(book_title) for book_title in titles}
+    
+    
     def check_book_availability(self):
-        book_names_list = self.get_all_book_names_from_database()
-        if self.book_title in book_names_list:
+        book = self.repository.get(self.book_title)
+        if book is not None:
             print(f"FINISH... \n{self.book_title} found in Book Lists...")
-            data = get_data_from_json_file()
-            if data[self.book_title]["Available"] == "True":
+            if book["Available"] == "True":
                 print(f"{self.book_title} is Available... :)")
             else:
                 raise BookNotAvailableError("SORRY! THE BOOK IS NOT AVAILABLE RIGHT NOW...")
@@ -141,77 +519,207 @@ class Book_Search:
             raise BookNotFoundError("404 NOT FOUND :)\nCannot found Book.")
 
 
-def library_management_cli():
-    while True:
-        user_input_menu  = int(input("Enter one of these options: \n\t1. Add new book to library\n\t2. Remove Book from library \n\t3. Search book name \n\t4. Book Availability\n\nWhich one (Just Type Number 1 to 4): "))
-        if user_input_menu == 1:
-            print("ADD NEW BOOK TO LIBRARY SECTION")
-            user_input_book_title = str(input("Enter Book Title: "))
-            user_input_book_author = str(input("Enter Book Author(s): "))
-            user_input_book_availability =  str(input("Enter Book Availability (True or False): "))
-            try:
-                user_new_book_add = SetBookInfo(user_input_book_title, user_input_book_author, user_input_book_availability)
-                print(f"Your Data is: \n {user_new_book_add.add_book_info_to_data_dict()}")
-                print(f"Adding New Book to Library... \n\tPlease Wait ...")
-                sleep(2)
-                user_new_book_add.update_database()
-                print("Adding Progress Successful.")
-                
-            except:
-                raise BookAddedError("Something went wrong...\n Cannot add book into library\n  Please try again later.")
-            return True
+BATCH_COMMANDS = ("add", "remove", "search", "available")
+
+def read_batch_commands(file_path):
+    """
+    Batch file: one command per line, fields separated by "|".
+
+        add Dune | Frank Herbert | True
+        remove Dune
+        search 1984
+        available 1984
+
+    Empty lines and lines starting with # are skipped.
+    """
+    with open(file_path, 'r', encoding="utf-8") as f1:
+        for line_number, line in enumerate(f1, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            command, _, rest = line.partition(" ")
+            yield line_number, command.lower(), [value.strip() for value in rest.split("|")]
+
+
+def run_batch(file_path, repository=None, verbose=True):
+    """
+    Run every command of a batch file against one loaded catalog.
+
+    Changes are written once at the end (one atomic file write for JSON, one
+    transaction for SQLite) instead of once per command. A failing command is
+    reported with its line number and the batch goes on.
+    Returns the counts per command, the errors and the throughput.
+    """
+    if repository is None:
+        repository = get_default_repository()
+    stats = dict.fromkeys(BATCH_COMMANDS, 0)
+    stats["errors"] = 0
+    start = perf_counter()
+    for line_number, command, values in read_batch_commands(file_path):
+        try:
+            if command == "add":
+                if len(values) != 3 or not values[0]:
+                    raise BookAddedError("add needs: title | author | True/False")
+                SetBookInfo(*values, repository=repository).add_book_info_to_data_dict()
+            elif command == "remove":
+                RemoveBook(values[0], repository=repository).remove_book()
+            elif command == "search":
+                book = repository.get(values[0])
+                if book is None:
+                    raise BookNotFoundError(f"{values[0]}: not found")
+                if verbose:
+                    print(f"{values[0]}: ID {book["ID"]}, Author {book["Author"]}, Available {book["Available"]}")
+            elif command == "available":
+                book = repository.get(values[0])
+                if book is None:
+                    raise BookNotFoundError(f"{values[0]}: not found")
+                if not BookSearchIndex.is_available(book["Available"]):
+                    raise BookNotAvailableError(f"{values[0]}: not available")
+                if verbose:
+                    print(f"{values[0]}: available")
+            else:
+                raise BookSearchError(f"unknown command {command!r} (use one of {', '.join(BATCH_COMMANDS)})")
+            stats[command] += 1
+        except (BookNotFoundError, BookNotAvailableError, BookAddedError, BookSearchError) as error:
+            stats["errors"] += 1
+            if verbose:
+                print(f"line {line_number} ({command}): {str(error).splitlines()[0]}")
+    repository.flush()
+    stats["seconds"] = perf_counter() - start
+    commands = sum(stats[command] for command in BATCH_COMMANDS) + stats["errors"]
+    stats["commands_per_second"] = commands / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def run_menu_option():
+    # One menu operation; returns False when the user chooses to exit.
+    user_input_menu  = int(input("Enter one of these options: \n\t1. Add new book to library\n\t2. Remove Book from library \n\t3. Search book name \n\t4. Book Availability\n\t5. Search by title words, author, ID or availability\n\t0. Exit\n\nWhich one (Just Type Number 0 to 5): "))
+    if user_input_menu == 1:
+        print("ADD NEW BOOK TO LIBRARY SECTION")
+        user_input_book_title = str(input("Enter Book Title: "))
+        user_input_book_author = str(input("Enter Book Author(s): "))
+        user_input_book_availability =  str(input("Enter Book Availability (True or False): "))
+        try:
+            user_new_book_add = SetBookInfo(user_input_book_title, user_input_book_author, user_input_book_availability)
+            print(f"Your Data is: \n {user_new_book_add.add_book_info_to_data_dict()}")
+            print(f"Adding New Book to Library...")
+            user_new_book_add.update_database()
+            print("Adding Progress Successful.")
+            
+        except:
+            raise BookAddedError("Something went wrong...\n Cannot add book into library\n  Please try again later.")
+        return True
+    
+    elif user_input_menu == 2:
+        print("REMOVE BOOK FROM LIBRARY SECTION")
+        user_input_book_title_to_remove = str(input("Enter Book Title to Search and Remove From Library: "))
+        try:
+            user_book_remove = RemoveBook(user_input_book_title_to_remove)
+            print(f"You Search Book Name: {user_book_remove}")
+            print(f"Search Progress Done.")
+            user_book_remove.check_book_search_result_and_remove_book()
+            print("Removing Progress Successful.")
+            
+        except:
+            raise BookRemoveError("Something went wrong...\n Cannot remove book from library\n  Please try again later.")
         
-        elif user_input_menu == 2:
-            print("REMOVE BOOK FROM LIBRARY SECTION")
-            user_input_book_title_to_remove = str(input("Enter Book Title to Search and Remove From Library: "))
-            try:
-                user_book_remove = RemoveBook(user_input_book_title_to_remove)
-                print(f"You Search Book Name: {user_book_remove}\n\t Please Wait ...")
-                sleep(2)
-                print(f"Search Progress Done.")
-                user_book_remove.check_book_search_result_and_remove_book()
-                print("Removing Progress Successful.")
-                
-            except:
-                raise BookRemoveError("Something went wrong...\n Cannot remove book from library\n  Please try again later.")
+        return True
             
-            return True
-                
-        elif user_input_menu == 3:
-            print("SEARCHING BOOK FROM LIBRARY SECTION")
-            user_input_book_name_to_search = str(input("Enter Book Title to Search: "))
-            try:
-                user_search_book_name = Book_Search(user_input_book_name_to_search)
-                print(f"You Search Book Name: {user_input_book_name_to_search}\n\t Please Wait ...")
-                sleep(2)
-                print(f"Search Progress Done.")
-                user_search_book_name.check_book_search_result()
-                print("Searching Progress Successful.")
-                
-            except:
-                raise BookSearchError("Something went wrong...\n Searching Progress Failed...\n  Please try again later.")
+    elif user_input_menu == 3:
+        print("SEARCHING BOOK FROM LIBRARY SECTION")
+        user_input_book_name_to_search = str(input("Enter Book Title to Search: "))
+        try:
+            user_search_book_name = Book_Search(user_input_book_name_to_search)
+            print(f"You Search Book Name: {user_input_book_name_to_search}")
+            print(f"Search Progress Done.")
+            user_search_book_name.check_book_search_result()
+            print("Searching Progress Successful.")
             
-            return True
+        except:
+            raise BookSearchError("Something went wrong...\n Searching Progress Failed...\n  Please try again later.")
         
+        return True
+    
+    
+    elif user_input_menu == 4:
+        user_input_book_name_availability = str(input(f"Enter Book Name to Check Availability: "))
+        try:
+            user_availability_book_name = Book_Search(user_input_book_name_availability)
+            print(f"You Search Book Name for Availability: {user_availability_book_name}")
+            print(f"Progress Done.")
+            user_availability_book_name.check_book_availability()
+            print("Searching and Availability Progress Successful.")
+            
+        except:
+            raise BookSearchError("Something went wrong...\n Searching Progress Fail...\n  Please try again later.")
         
-        elif user_input_menu == 4:
-            user_input_book_name_availability = str(input(f"Enter Book Name to Check Availability: "))
-            try:
-                user_availability_book_name = Book_Search(user_input_book_name_availability)
-                print(f"You Search Book Name for Availability: {user_availability_book_name}\n\t Please Wait ...")
-                sleep(2)
-                print(f"Progress Done.")
-                user_availability_book_name.check_book_availability()
-                print("Searching and Availability Progress Successful.")
-                
-            except:
-                raise BookSearchError("Something went wrong...\n Searching Progress Fail...\n  Please try again later.")
+        return True
+    
+    elif user_input_menu == 5:
+        print("ADVANCED BOOK SEARCH SECTION (leave a field empty to skip it)")
+        user_input_title_words = str(input("Title words (or the start of them): "))
+        user_input_author = str(input("Author: "))
+        user_input_book_id = str(input("Book ID: "))
+        user_input_availability = str(input("Available (True/False): "))
+        try:
+            found_books = Book_Search(user_input_title_words).search_books(
+                author=user_input_author or None,
+                book_id=user_input_book_id or None,
+                available=user_input_availability or None)
+            for book_title, book in found_books.items():
+                print(f"Book Name: \t {book_title}\nBook ID: \t {book["ID"]}\nBook Author: \t {book["Author"]}\nBook Availability: \t {book["Available"]}\n")
+            print(f"{len(found_books)} book(s) found.")
             
-            return True
-                
+        except:
+            raise BookSearchError("Something went wrong...\n Searching Progress Fail...\n  Please try again later.")
+        
+        return True
+    
+    elif user_input_menu == 0:
+        return False
+    
+    else:
+        print("Just Type Number 0 to 5.")
+        return True
+
+
+def library_management_cli():
+    # Keeps asking until the user exits; a failed operation is reported, not fatal.
+    while True:
+        try:
+            if not run_menu_option():
+                break
+        except (BookAddedError, BookRemoveError, BookSearchError, ValueError) as error:
+            print(error)
+        except EOFError:
+            break
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Library Management System")
+    parser.add_argument("--database", default=DATABASE_PATH,
+                        help="library database; a .db/.sqlite file uses the SQLite backend")
+    parser.add_argument("--migrate-to", metavar="SQLITE_PATH",
+                        help="copy the JSON --database into this SQLite file and exit")
+    parser.add_argument("--batch", metavar="COMMAND_FILE",
+                        help="run add/remove/search/available commands from a file and exit")
+    parser.add_argument("--quiet", action="store_true", help="batch mode: print only the summary")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    library_management_cli()
+    args = get_args()
+    if args.migrate_to:
+        print(f"{migrate_json_to_sqlite(args.database, args.migrate_to)} book(s) migrated to {args.migrate_to}")
+    else:
+        with open_repository(args.database) as repository:
+            set_default_repository(repository)
+            if args.batch:
+                stats = run_batch(args.batch, repository, verbose=not args.quiet)
+                print(f"added {stats['add']}, removed {stats['remove']}, searched {stats['search']}, "
+                      f"checked {stats['available']}, errors {stats['errors']}")
+                print(f"{stats['seconds']:.3f} s, {stats['commands_per_second']:.0f} commands/s")
+            else:
+                library_management_cli()
             
         
\ No newline at end of file
@@ -1,8 +1,39 @@
 from dataclasses import dataclass
+import argparse
 import json
 from random import sample
 from time import sleep
 from datetime import datetime
+from atomic_writer import FLUSH_INTERVAL, CoalescingWriter, atomic_write_json
+
+NOTES_DATABASE_PATH = "./files/notes-database.json"
+# None: every change is written (and fsynced) at once. After
+# enable_write_coalescing(), quick successive changes are written once per interval.
+notes_writer = None
+
+def enable_write_coalescing(flush_interval=FLUSH_INTERVAL):
+    global notes_writer
+    if notes_writer is None:
+        notes_writer = CoalescingWriter(flush_interval)
+    return notes_writer
+
+def load_notes_database():
+    if notes_writer is not None:
+        data = notes_writer.pending_data(NOTES_DATABASE_PATH)
+        if data is not None:
+            return data
+    try:
+        with open(NOTES_DATABASE_PATH, 'r') as f1:
+            data:dict = json.loads(f1.read())
+    except FileNotFoundError:
+        data = {}
+    return data
+
+def save_notes_database(data):
+    if notes_writer is not None:
+        notes_writer.write(NOTES_DATABASE_PATH, data)
+    else:
+        atomic_write_json(NOTES_DATABASE_PATH, data)
 
 class InvalidOptionError(Exception):
     pass
@@ -20,12 +51,7 @@ class Note:
     
     
     def get_data_from_json_file(self):
-        try:
-            with open("./files/notes-database.json", 'r') as f1:
-                data:dict = json.loads(f1.read())
-        except FileNotFoundError:
-            data = {}
-        return data
+        return load_notes_database()
 
     def create_note(self):
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -37,8 +63,7 @@ class Note:
             "Created_At": current_time,
             "Updated_At": current_time
         }
-        with open("./files/notes-database.json", 'w') as f1:
-            f1.write(json.dumps(data))
+        save_notes_database(data)
     
     def display_note(self):
         data = self.get_data_from_json_file()
@@ -48,14 +73,12 @@ class Note:
     def update_database(self):
         data = self.get_data_from_json_file()
         updated_data = self.create_note(data)
-        with open("./files/notes-database.json", 'w') as f1:
-            f1.write(json.dumps(updated_data))        
+        save_notes_database(updated_data)        
     
     def remove_note(self):
         data = self.get_data_from_json_file()
         del data[self.note_file_name]
-        with open("./files/notes-database.json", 'w') as f1:
-            f1.write(json.dumps(data))
+        save_notes_database(data)
 
     def update_note(self):
         data = self.get_data_from_json_file()
@@ -64,8 +87,7 @@ class Note:
             data[self.note_file_name]["Title"] = self.note_content_title
             data[self.note_file_name]["Body"] = self.note_content_body
             data[self.note_file_name]["Updated_At"] = current_time
-            with open("./files/notes-database.json", 'w') as f1:
-                f1.write(json.dumps(data))
+            save_notes_database(data)
         else:
             raise KeyError("Note not found in the database.")
     
@@ -75,12 +97,7 @@ class Note_Database:
     note_file_name: str
     
     def get_data_from_json_file(self):
-        try:
-            with open("./files/notes-database.json", 'r') as f1:
-                data:dict = json.loads(f1.read())
-        except FileNotFoundError:
-            data = {}
-        return data
+        return load_notes_database()
     
     def show_all_nots(self):
         data = self.get_data_from_json_file()
@@ -187,5 +204,16 @@ def user_flow():
 
 
 
+def get_args():
+    parser = argparse.ArgumentParser(description="Notes Management System")
+    parser.add_argument("--coalesce-writes", nargs="?", type=float, const=FLUSH_INTERVAL, metavar="SECONDS",
+                        help="write the notes database at most once every SECONDS (default 0.5) "
+                             "instead of once per change; pending changes are written on exit")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = get_args()
+    if args.coalesce_writes is not None:
+        enable_write_coalescing(args.coalesce_writes)
     user_flow()
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Docstring for 03_OOP.atomic_writer
+
+Crash-safe writes for the small JSON "databases" used by the exercises.
+
+Opening a file with 'w' empties it first, so a crash (or Ctrl+C) in the middle
+of writing leaves a truncated file and the data is lost. Here the new content
+is written to a temp file in the same folder, flushed to disk with fsync, and
+then renamed over the old file. A rename inside one folder is atomic: readers
+see either the whole old file or the whole new one.
+
+atomic_write       -> write str/bytes atomically
+atomic_write_json  -> json.dumps + atomic_write
+CoalescingWriter   -> keeps only the latest content per file and writes it at
+                      most once every `flush_interval` seconds, so many quick
+                      edits cost one fsync instead of one each
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+
+FLUSH_INTERVAL = 0.5  # seconds
+
+
+def _fsync_directory(directory):
+    # Makes the rename itself durable. Not possible on Windows; skip there.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data, encoding="utf-8", fsync=True):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as TempFile:
+            TempFile.write(data.encode(encoding) if isinstance(data, str) else data)
+            TempFile.flush()
+            if fsync:
+                os.fsync(TempFile.fileno())
+        try:
+            # mkstemp creates the file as 0600; keep the old file's permissions.
+            os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    if fsync:
+        _fsync_directory(directory)
+
+
+def atomic_write_json(path, data, fsync=True, **dump_kwargs):
+    atomic_write(path, json.dumps(data, **dump_kwargs), fsync=fsync)
+
+
+class CoalescingWriter:
+    """
+    Write-behind buffer on top of atomic_write.
+
+    write() serializes the data right away (so later changes to the caller's
+    dict cannot leak into, or break, a write running in the timer thread) and
+    only remembers the latest JSON text per path. The first write after a
+    flush starts a timer; when it fires (flush_interval seconds later) every
+    pending file is written once. flush() writes immediately, and close() (also
+    called at interpreter exit) makes sure nothing pending is lost. A file
+    whose write fails stays pending and is tried again by the next flush.
+    """
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL, fsync=True, **dump_kwargs):
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.dump_kwargs = dump_kwargs
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.timer = None
+        self.writes = 0
+        atexit.register(self.close)
+
+    def write(self, path, data):
+        text = json.dumps(data, **self.dump_kwargs)
+        with self.lock:
+            self.pending[path] = text
+            if self.flush_interval > 0 and self.timer is None:
+                self.timer = threading.Timer(self.flush_interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        if self.flush_interval <= 0:
+            self.flush()
+
+    def pending_data(self, path, default=None):
+        # A fresh copy of the data written but not flushed yet; readers check
+        # this first so they never see the older file contents.
+        with self.lock:
+            text = self.pending.get(path)
+        return default if text is None else json.loads(text)
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            # Written under the lock, so two flushes never race on the same file.
+            first_error = None
+            for path, text in pending.items():
+                try:
+                    atomic_write(path, text, fsync=self.fsync)
+                    self.writes += 1
+                except OSError as error:
+                    self.pending[path] = text
+                    first_error = first_error or error
+            if first_error is not None:
+                raise first_error
+
+    def close(self):
+        atexit.unregister(self.close)
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+if __name__ == "__main__":
+    demo_path = os.path.join(tempfile.gettempdir(), "atomic_writer_demo.json")
+    with CoalescingWriter(flush_interval=0.2) as writer:
+        start = time.perf_counter()
+        for i in range(1000):
+            writer.write(demo_path, {"counter": i})
+    print(f"1000 edits -> {writer.writes} write(s) in {time.perf_counter() - start:.3f} s")
+    with open(demo_path, "r", encoding="utf-8") as DemoFile:
+        print(json.load(DemoFile))